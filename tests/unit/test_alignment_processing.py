@@ -3,14 +3,23 @@
 
 """
 Unit tests for alignment processing scripts.
-Tests include functionality for checking BWA index completeness
-and aligning/sorting FASTQ files.
+Tests include functionality for checking BWA index completeness,
+aligning/sorting FASTQ files, the alignment cache key and its .causal
+sidecar, and running piped commands.
 """
 
+import os
+import shutil
+
 import pytest
 import logging
 from pathlib import Path
-from vntyper.scripts.alignment_processing import check_bwa_index, align_and_sort_fastq
+from vntyper.scripts.alignment_processing import (
+    alignment_cache_key,
+    check_bwa_index,
+    align_and_sort_fastq,
+    run_piped_commands,
+)
 
 
 def test_check_bwa_index_all_present(tmp_path, test_config, caplog):
@@ -60,3 +69,185 @@ def test_align_and_sort_fastq_missing_tools(tmp_path, test_config):
         "Expected None when tools are missing, because 'samtools'/'bwa' "
         "are not configured in config_for_test['tools']."
     )
+
+
+@pytest.fixture
+def alignment_inputs(tmp_path):
+    """
+    Small stand-ins for the FASTQs, the reference and the tool executables.
+    """
+    inputs = {}
+    for name in ("R1.fastq", "R2.fastq", "ref.fa", "bwa", "samtools", "fastp"):
+        path = tmp_path / name
+        path.write_text(name)
+        inputs[name] = path
+    return inputs
+
+
+def _cache_key(inputs, fastp=False):
+    return alignment_cache_key(
+        inputs["R1.fastq"],
+        inputs["R2.fastq"],
+        inputs["ref.fa"],
+        inputs["bwa"],
+        inputs["samtools"],
+        inputs["fastp"] if fastp else None,
+    )
+
+
+def test_alignment_cache_key_stable(alignment_inputs):
+    key = _cache_key(alignment_inputs)
+    assert key is not None
+    assert _cache_key(alignment_inputs) == key
+
+
+@pytest.mark.parametrize("name", ["R1.fastq", "R2.fastq", "ref.fa", "bwa", "samtools"])
+def test_alignment_cache_key_changes_with_mtime(alignment_inputs, name):
+    """
+    Touching any input or tool invalidates the key.
+    """
+    key = _cache_key(alignment_inputs)
+    st = os.stat(alignment_inputs[name])
+    os.utime(alignment_inputs[name], ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert _cache_key(alignment_inputs) != key
+
+
+def test_alignment_cache_key_fastp_prefetch(alignment_inputs):
+    """
+    Streaming the reads through fastp gives a different key, which also
+    follows the fastp executable.
+    """
+    key = _cache_key(alignment_inputs)
+    prefetch_key = _cache_key(alignment_inputs, fastp=True)
+    assert prefetch_key != key
+
+    st = os.stat(alignment_inputs["fastp"])
+    os.utime(alignment_inputs["fastp"], ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert _cache_key(alignment_inputs, fastp=True) != prefetch_key
+    assert _cache_key(alignment_inputs) == key
+
+
+def test_alignment_cache_key_missing_input(alignment_inputs):
+    alignment_inputs["R2.fastq"].unlink()
+    assert _cache_key(alignment_inputs) is None
+
+
+def _align(inputs, output_dir):
+    config = {
+        "tools": {
+            "bwa": str(inputs["bwa"]),
+            "samtools": str(inputs["samtools"]),
+        }
+    }
+    return align_and_sort_fastq(
+        fastq1=inputs["R1.fastq"],
+        fastq2=inputs["R2.fastq"],
+        reference=inputs["ref.fa"],
+        output_dir=output_dir,
+        output_name="test",
+        threads=1,
+        config=config,
+    )
+
+
+def _previous_run(output_dir, sidecar_text):
+    output_dir.mkdir(exist_ok=True)
+    bam = output_dir / "test_sorted.bam"
+    bam.write_bytes(b"BAM")
+    (output_dir / "test_sorted.bam.bai").write_bytes(b"BAI")
+    causal = output_dir / "test_sorted.bam.causal"
+    causal.write_text(sidecar_text + "\n")
+    return bam, causal
+
+
+def test_align_and_sort_fastq_reuses_current_bam(tmp_path, alignment_inputs):
+    """
+    A sorted BAM whose .causal sidecar matches the inputs is returned
+    without aligning (the reference has no BWA index here, so any attempt
+    to align would fail).
+    """
+    output_dir = tmp_path / "align_output"
+    bam, causal = _previous_run(output_dir, _cache_key(alignment_inputs))
+
+    assert _align(alignment_inputs, output_dir) == str(bam)
+    assert causal.exists()
+
+
+def test_align_and_sort_fastq_removes_stale_sidecar(tmp_path, alignment_inputs):
+    """
+    A sidecar from different inputs is removed before re-running, so an
+    interrupted or failed re-run is never taken as current.
+    """
+    output_dir = tmp_path / "align_output"
+    _, causal = _previous_run(output_dir, "stale-key")
+
+    # Fails at the BWA index check, after the stale sidecar is handled
+    assert _align(alignment_inputs, output_dir) is None
+    assert not causal.exists()
+
+
+def test_align_and_sort_fastq_sidecar_invalidated_by_input_change(
+    tmp_path, alignment_inputs
+):
+    output_dir = tmp_path / "align_output"
+    _, causal = _previous_run(output_dir, _cache_key(alignment_inputs))
+    st = os.stat(alignment_inputs["R1.fastq"])
+    os.utime(alignment_inputs["R1.fastq"], ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    assert _align(alignment_inputs, output_dir) is None
+    assert not causal.exists()
+
+
+@pytest.mark.skipif(
+    not (shutil.which("true") and shutil.which("false")),
+    reason="needs the true/false commands",
+)
+@pytest.mark.parametrize(
+    "commands, expected",
+    [
+        ([["true"], ["true"], ["true"]], [0, 0, 0]),
+        ([["false"], ["true"], ["true"]], [1, 0, 0]),
+        ([["true"], ["false"], ["true"]], [0, 1, 0]),
+        ([["true"], ["true"], ["false"]], [0, 0, 1]),
+    ],
+)
+def test_run_piped_commands_exit_codes(tmp_path, commands, expected):
+    """
+    The exit code of every stage is reported, so a failure anywhere in the
+    pipe is seen by the caller.
+    """
+    with open(tmp_path / "pipe.log", "w") as log:
+        returncodes = run_piped_commands(commands, log)
+    assert returncodes == expected
+    assert any(returncodes) == any(expected)
+
+
+def test_run_piped_commands_launch_failure(tmp_path):
+    """
+    A stage that cannot be started gives None; the stages already started
+    are stopped.
+    """
+    with open(tmp_path / "pipe.log", "w") as log:
+        assert (
+            run_piped_commands([["true"], [str(tmp_path / "no-such-tool")]], log)
+            is None
+        )
+
+
+def test_run_piped_commands_streams_data(tmp_path):
+    """
+    Each stage's stdout feeds the next one's stdin; stderr goes to the log.
+    """
+    out = tmp_path / "out.txt"
+    with open(tmp_path / "pipe.log", "w") as log:
+        returncodes = run_piped_commands(
+            [
+                ["printf", "b\\na\\nb\\n"],
+                ["sort", "-u"],
+                ["sh", "-c", f"cat > '{out}'; echo done >&2"],
+            ],
+            log,
+        )
+    assert returncodes == [0, 0, 0]
+    assert out.read_text() == "a\nb\n"
+    assert (tmp_path / "pipe.log").read_text() == "done\n"
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# tests/unit/test_cli.py
+
+"""
+Unit tests for cli.py, focusing on:
+  _requested_subcommand()
+
+Ensures only the subcommand actually named on the command line is picked,
+even when a global option's value happens to be a subcommand name.
+"""
+
+import pytest
+
+from vntyper import cli
+from vntyper.cli import _requested_subcommand
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["pipeline", "--bam", "x.bam"], "pipeline"),
+        (["-l", "DEBUG", "report", "-o", "out"], "report"),
+        (["-lDEBUG", "cohort"], "cohort"),
+        (["--log-level=INFO", "install-references"], "install-references"),
+        # Option values that are subcommand names
+        (["-f", "report", "pipeline", "-o", "report"], "pipeline"),
+        (["--log-file", "cohort", "online"], "online"),
+        (["--config-path", "X", "pipeline"], "pipeline"),
+        (["--config-path", "report", "pipeline"], "pipeline"),
+        # Abbreviated long options, as argparse accepts them
+        (["--log-l", "DEBUG", "report"], "report"),
+        (["--config", "report", "pipeline"], "pipeline"),
+        (["--log-f", "report", "cohort"], "cohort"),
+        # Global options after the subcommand
+        (["pipeline", "-l", "DEBUG", "--log-file", "report"], "pipeline"),
+        # Subcommand options that also name subcommands
+        (["cohort", "-i", "report", "pipeline"], "cohort"),
+    ],
+)
+def test_requested_subcommand(argv, expected):
+    assert _requested_subcommand(argv) == expected
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["--help"],
+        ["-l", "DEBUG"],
+        ["--config-path", "pipeline"],
+        ["unknown", "pipeline"],
+        # Ambiguous abbreviation (--log-level / --log-file)
+        ["--log", "DEBUG", "report"],
+        # Invalid global option value
+        ["-l", "LOUD", "report"],
+    ],
+)
+def test_requested_subcommand_none(argv):
+    """
+    No subcommand, or a command line the global options do not parse:
+    None, so every subparser is built and argparse reports any error.
+    """
+    assert _requested_subcommand(argv) is None
+
+
+def test_requested_subcommand_version_does_not_exit(capsys):
+    """
+    --version is left to the real parser: detecting the subcommand neither
+    prints nor exits.
+    """
+    assert _requested_subcommand(["--version"]) is None
+    assert _requested_subcommand(["-v", "report"]) == "report"
+    assert capsys.readouterr().out == ""
+
+
+def test_main_without_subcommand_prints_help(monkeypatch, capsys):
+    monkeypatch.setattr(cli.sys, "argv", ["vntyper"])
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main()
+    assert excinfo.value.code == 0
+    out = capsys.readouterr().out
+    for name in cli.SUBCOMMAND_PARSERS:
+        assert name in out
+
+
+def test_main_version(monkeypatch, capsys):
+    monkeypatch.setattr(cli.sys, "argv", ["vntyper", "--version"])
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main()
+    assert excinfo.value.code == 0
+    assert cli.VERSION in capsys.readouterr().out
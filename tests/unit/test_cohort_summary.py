@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# tests/unit/test_cohort_summary.py
+
+"""
+Unit tests for cohort_summary.py, focusing on the per-sample summary cache:
+  load_pipeline_summary_cached()
+  summary_cache_file()
+  prune_summary_cache()
+
+Ensures cached records are reused only while the summary is unchanged, and
+that pruning removes only the entries of stale or absent samples.
+"""
+
+import json
+import os
+
+import pytest
+
+from vntyper.scripts import cohort_summary
+from vntyper.scripts.cohort_summary import (
+    load_pipeline_summary_cached,
+    prune_summary_cache,
+    summary_cache_file,
+)
+
+
+def _write_summary(sample_dir, confidence):
+    """
+    Writes a minimal pipeline_summary.json with one Kestrel and one adVNTR
+    record.
+    """
+    sample_dir.mkdir(parents=True, exist_ok=True)
+    summary = {
+        "steps": [
+            {
+                "step": "Kestrel Genotyping",
+                "parsed_result": {"data": [{"Confidence": confidence}]},
+            },
+            {
+                "step": "adVNTR Genotyping",
+                "parsed_result": {"data": [{"Pvalue": "Negative"}]},
+            },
+        ]
+    }
+    path = sample_dir / "pipeline_summary.json"
+    path.write_text(json.dumps(summary))
+    return path
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "cohort_out" / ".cohort_cache"
+
+
+def test_cached_summary_is_reused(tmp_path, cache_dir, monkeypatch):
+    """
+    The second load of an unchanged summary comes from the cache.
+    """
+    sample = tmp_path / "sample1"
+    _write_summary(sample, "High_Precision")
+
+    first = load_pipeline_summary_cached(sample, cache_dir)
+    assert first == ([{"Confidence": "High_Precision"}], [{"Pvalue": "Negative"}])
+    assert summary_cache_file(sample, cache_dir).exists()
+
+    def fail(sample_dir):
+        raise AssertionError("summary parsed again despite a current cache entry")
+
+    monkeypatch.setattr(cohort_summary, "load_pipeline_summary_for_sample", fail)
+    assert load_pipeline_summary_cached(sample, cache_dir) == first
+
+
+def test_edited_summary_is_reloaded(tmp_path, cache_dir):
+    """
+    Editing the summary changes its cache key, so the new content is read.
+    """
+    sample = tmp_path / "sample1"
+    path = _write_summary(sample, "High_Precision")
+    load_pipeline_summary_cached(sample, cache_dir)
+    old_entry = summary_cache_file(sample, cache_dir)
+
+    # Same size, so only the mtime tells the versions apart
+    _write_summary(sample, "Low_Precision_")
+    _bump_mtime(path)
+
+    kestrel, _ = load_pipeline_summary_cached(sample, cache_dir)
+    assert kestrel == [{"Confidence": "Low_Precision_"}]
+    assert summary_cache_file(sample, cache_dir) != old_entry
+
+
+def test_missing_summary(tmp_path, cache_dir):
+    assert summary_cache_file(tmp_path / "absent", cache_dir) is None
+    assert load_pipeline_summary_cached(tmp_path / "absent", cache_dir) == ([], [])
+    assert not cache_dir.exists()
+
+
+def test_prune_removes_only_stale_entries(tmp_path, cache_dir):
+    """
+    Entries of samples left out of the run and of edited summaries are
+    deleted; the entries of the current samples are kept.
+    """
+    kept, edited, dropped = (tmp_path / name for name in ("kept", "edited", "dropped"))
+    for sample in (kept, edited, dropped):
+        _write_summary(sample, "High_Precision")
+        load_pipeline_summary_cached(sample, cache_dir)
+    stale_entry = summary_cache_file(edited, cache_dir)
+    dropped_entry = summary_cache_file(dropped, cache_dir)
+
+    _bump_mtime(edited / "pipeline_summary.json")
+    load_pipeline_summary_cached(edited, cache_dir)
+
+    current = {summary_cache_file(sample, cache_dir) for sample in (kept, edited)}
+    prune_summary_cache(cache_dir, {entry.name for entry in current})
+
+    assert set(cache_dir.iterdir()) == current
+    assert not stale_entry.exists()
+    assert not dropped_entry.exists()
+
+
+def test_prune_missing_cache_dir(tmp_path):
+    # Nothing cached yet: pruning is a no-op
+    prune_summary_cache(tmp_path / "no_cache", set())
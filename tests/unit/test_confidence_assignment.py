@@ -7,8 +7,10 @@ Validates confidence levels based on depth scores and thresholds
 from vntyper/scripts/kestrel_config.json.
 """
 
+import itertools
 import json
 import pytest
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from vntyper.scripts.confidence_assignment import (
@@ -102,3 +104,112 @@ def test_calculate_depth_score_high_precision(kestrel_config):
     assert (
         out.loc[0, "Confidence"] == high_star_label
     ), "Expected 'High_Precision*' for depth_score=0.02 with alt=100 >= mid_high=100"
+
+
+def _sequential_confidence(alt, region, conf):
+    """
+    Reference for the label precedence: the five conditions applied as
+    successive overwrites of a 'Negative' default, later ones winning.
+    """
+    low_t = conf["depth_score_thresholds"]["low"]
+    high_t = conf["depth_score_thresholds"]["high"]
+    alt_low = conf["alt_depth_thresholds"]["low"]
+    mid_low = conf["alt_depth_thresholds"]["mid_low"]
+    mid_high = conf["alt_depth_thresholds"]["mid_high"]
+    levels = conf["confidence_levels"]
+    score = alt / region if region else np.nan
+
+    label = "Negative"
+    if score <= low_t or region <= conf["var_active_region_threshold"]:
+        label = levels["low_precision"]
+    if alt >= mid_high and score >= high_t:
+        label = levels["high_precision_star"]
+    if mid_low <= alt <= mid_high and low_t <= score <= high_t:
+        label = levels["low_precision"]
+    if alt <= alt_low:
+        label = levels["low_precision"]
+    if mid_low <= alt < mid_high and score >= high_t:
+        label = levels["high_precision"]
+    return label
+
+
+@pytest.fixture
+def boundary_config():
+    """
+    Small thresholds, so every condition and boundary is reachable with
+    few reads.
+    """
+    return {
+        "confidence_assignment": {
+            "depth_score_thresholds": {"low": 0.2, "high": 0.4},
+            "alt_depth_thresholds": {"low": 5, "mid_low": 10, "mid_high": 20},
+            "var_active_region_threshold": 30,
+            "confidence_levels": {
+                "low_precision": "Low_Precision",
+                "high_precision": "High_Precision",
+                "high_precision_star": "High_Precision*",
+            },
+        }
+    }
+
+
+def test_confidence_precedence_matches_sequential_overwrites(boundary_config):
+    """
+    Every combination of alt depths and region depths around the thresholds
+    (including a zero region depth, whose Depth_Score is NaN) gets the label
+    the successive overwrites would assign.
+    """
+    alts = [0, 4, 5, 6, 9, 10, 11, 19, 20, 21, 40]
+    regions = [0, 10, 25, 30, 31, 40, 50, 100, 1000]
+    pairs = list(itertools.product(alts, regions))
+    df = pd.DataFrame(
+        {
+            "Estimated_Depth_AlternateVariant": [str(a) for a, _ in pairs],
+            "Estimated_Depth_Variant_ActiveRegion": [str(r) for _, r in pairs],
+        }
+    )
+    conf = boundary_config["confidence_assignment"]
+    out = calculate_depth_score_and_assign_confidence(df, boundary_config)
+
+    expected = [_sequential_confidence(a, r, conf) for a, r in pairs]
+    assert out["Confidence"].tolist() == expected
+    assert {"High_Precision", "High_Precision*", "Low_Precision", "Negative"} <= set(
+        expected
+    ), "The grid should reach every label."
+    assert out["depth_confidence_pass"].tolist() == [
+        label != "Negative" for label in expected
+    ]
+
+
+def test_confidence_zero_region_depth(boundary_config):
+    """
+    A zero active-region depth gives a NaN Depth_Score (not inf) and is
+    labelled by the region-depth condition.
+    """
+    df = pd.DataFrame(
+        {
+            "Estimated_Depth_AlternateVariant": [15, 0],
+            "Estimated_Depth_Variant_ActiveRegion": [0, 0],
+        }
+    )
+    out = calculate_depth_score_and_assign_confidence(df, boundary_config)
+    assert out["Depth_Score"].isna().all()
+    assert out["Confidence"].tolist() == ["Low_Precision", "Low_Precision"]
+
+
+def test_confidence_with_repository_thresholds(kestrel_config):
+    """
+    The shipped thresholds give the same labels as the successive overwrites.
+    """
+    conf = kestrel_config["confidence_assignment"]
+    pairs = list(itertools.product([0, 5, 10, 20, 50, 100, 200], [0, 100, 5000, 20000]))
+    df = pd.DataFrame(
+        {
+            "Estimated_Depth_AlternateVariant": [a for a, _ in pairs],
+            "Estimated_Depth_Variant_ActiveRegion": [r for _, r in pairs],
+        }
+    )
+    out = calculate_depth_score_and_assign_confidence(df, kestrel_config)
+    assert out["Confidence"].tolist() == [
+        _sequential_confidence(a, r, conf) for a, r in pairs
+    ]
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# tests/unit/test_generate_report.py
+
+"""
+Unit tests for generate_report.py, focusing on:
+  _fast_to_html()
+
+Ensures the report tables are rendered exactly as
+DataFrame.to_html(index=False) renders them.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vntyper.scripts.generate_report import _fast_to_html
+
+CLASSES = "table table-bordered table-striped hover compact order-column table-sm"
+
+
+@pytest.mark.parametrize("escape", [True, False])
+@pytest.mark.parametrize(
+    "df",
+    [
+        pytest.param(
+            pd.DataFrame(
+                {
+                    "Motif": ["X-Y", "<b>A&B</b>", " padded ", "tab\there\nnewline"],
+                    "Depth Score": ["0.0123", np.nan, None, "1e-05"],
+                    "Position": ["67", "68", "69", "70"],
+                }
+            ),
+            id="strings_with_html_special_and_missing",
+        ),
+        pytest.param(
+            pd.DataFrame(
+                {
+                    "Depth_Score": [0.1, np.nan, 0.123456789, 2.0],
+                    "POS": [67, 68, 69, 70],
+                    "Motif": ["X", "<Y>", "Z&", None],
+                }
+            ),
+            id="float_and_nan_columns",
+        ),
+        pytest.param(
+            pd.DataFrame({"Depth_Score": [0.5, "0.25", np.nan], "Flag": [True] * 3}),
+            id="float_in_object_column",
+        ),
+        pytest.param(
+            pd.DataFrame(
+                {
+                    "Confidence": pd.Categorical(
+                        [
+                            '<span style="color:red;">High_Precision</span>',
+                            "Negative",
+                            None,
+                        ]
+                    ),
+                    "POS": [1, 2, 3],
+                    "Passed": [True, False, True],
+                }
+            ),
+            id="categorical_int_bool",
+        ),
+        pytest.param(
+            pd.DataFrame(columns=["VID", "Variant", "Pvalue"]),
+            id="empty",
+        ),
+    ],
+)
+def test_fast_to_html_matches_to_html(df, escape):
+    expected = df.to_html(index=False, classes=CLASSES, escape=escape)
+    assert _fast_to_html(df, classes=CLASSES, escape=escape) == expected
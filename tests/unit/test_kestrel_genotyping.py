@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# tests/unit/test_kestrel_genotyping.py
+
+"""
+Unit tests for kestrel_genotyping.py, focusing on:
+  write_tsv()
+
+Ensures the TSV outputs match DataFrame.to_csv(sep="\\t", index=False),
+whether they are written by Arrow's CSV writer or by pandas.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vntyper.scripts import kestrel_genotyping
+from vntyper.scripts.kestrel_genotyping import write_tsv
+
+
+@pytest.fixture
+def mixed_df():
+    """
+    Columns of the dtypes found in the Kestrel results: bool, float (with
+    NaN), int, object str (with missing values) and categorical.
+    """
+    return pd.DataFrame(
+        {
+            "Motif": ["X-Y", None, "A-B", "C"],
+            "POS": [67, 68, 1000, 5],
+            "Depth_Score": [0.1, np.nan, 1e-05, 2.0 / 3.0],
+            "is_valid_frameshift": [True, False, True, False],
+            "Confidence": pd.Categorical(
+                ["Low_Precision", "High_Precision", None, "Low_Precision"]
+            ),
+        }
+    )
+
+
+def _expected_tsv(df, header_lines=()):
+    return "".join(line + "\n" for line in header_lines) + df.to_csv(
+        sep="\t", index=False
+    )
+
+
+def test_write_tsv_matches_to_csv(tmp_path, mixed_df):
+    """
+    The Arrow writer (when pyarrow is installed) produces exactly the text
+    written by to_csv, including the header lines.
+    """
+    out = tmp_path / "result.tsv"
+    header = ["## VNtyper", "## Kestrel"]
+    write_tsv(mixed_df, out, header)
+    assert out.read_text() == _expected_tsv(mixed_df, header)
+
+
+def test_write_tsv_without_pyarrow(tmp_path, mixed_df, monkeypatch):
+    """
+    Without pyarrow the frame is written by pandas.
+    """
+    monkeypatch.setattr(kestrel_genotyping, "pacsv", None)
+    out = tmp_path / "result.tsv"
+    write_tsv(mixed_df, out)
+    assert out.read_text() == _expected_tsv(mixed_df)
+
+
+def test_write_tsv_falls_back_on_old_pyarrow(tmp_path, mixed_df, monkeypatch):
+    """
+    pyarrow versions whose WriteOptions lack quoting_style raise TypeError;
+    the frame is then written by pandas instead of failing.
+    """
+    pacsv = pytest.importorskip("pyarrow.csv")
+
+    def old_write_options(**kwargs):
+        if "quoting_style" in kwargs:
+            raise TypeError("unexpected keyword argument 'quoting_style'")
+        return pacsv.WriteOptions(**kwargs)
+
+    monkeypatch.setattr(pacsv, "WriteOptions", old_write_options)
+    out = tmp_path / "result.tsv"
+    write_tsv(mixed_df, out)
+    assert out.read_text() == _expected_tsv(mixed_df)
+
+
+def test_write_tsv_empty_frame(tmp_path):
+    """
+    A frame with columns but no rows is written as its header only.
+    """
+    df = pd.DataFrame(columns=["Motif", "POS", "Confidence"])
+    out = tmp_path / "empty.tsv"
+    write_tsv(df, out)
+    assert out.read_text() == _expected_tsv(df)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# tests/unit/test_motif_processing.py
+
+"""
+Unit tests for motif_processing.py, focusing on:
+  preprocessing_variants()
+  _best_row_per_alt()
+
+Ensures the combined insertion/deletion preprocessing matches the separate
+functions, and that the per-ALT selection keeps the same rows as the
+stable descending sort followed by drop_duplicates("ALT") it replaces.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vntyper.scripts.motif_processing import (
+    _best_row_per_alt,
+    preprocessing_deletion,
+    preprocessing_insertion,
+    preprocessing_variants,
+)
+
+
+@pytest.fixture
+def muc1_ref():
+    return pd.DataFrame({"Motifs": ["X", "Y"], "Motif_sequence": ["ACGT", "GGCC"]})
+
+
+def _vcf(motifs, sample):
+    return pd.DataFrame(
+        {
+            "#CHROM": motifs,
+            "POS": range(1, len(motifs) + 1),
+            "ID": ".",
+            "REF": "A",
+            "ALT": "AC",
+            "QUAL": ".",
+            "FILTER": "PASS",
+            "INFO": ".",
+            "FORMAT": "GT",
+            sample: "0/1",
+        }
+    )
+
+
+def test_preprocessing_variants_matches_separate_functions(muc1_ref):
+    """
+    The combined preprocessing equals the insertion and deletion results
+    concatenated, and leaves its inputs unchanged.
+    """
+    insertion = _vcf(["X", "Z"], "sample1")
+    deletion = _vcf(["Y"], "sample1")
+    combined = preprocessing_variants(insertion, deletion, muc1_ref)
+    expected = pd.concat(
+        [
+            preprocessing_insertion(insertion, muc1_ref),
+            preprocessing_deletion(deletion, muc1_ref),
+        ],
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(combined, expected)
+    assert list(combined.columns) == [
+        "Motifs",
+        "POS",
+        "REF",
+        "ALT",
+        "Sample",
+        "Motif_sequence",
+        "Variant",
+    ]
+    assert combined["Variant"].tolist() == ["Insertion", "Insertion", "Deletion"]
+    assert "#CHROM" in insertion.columns
+
+
+def test_preprocessing_variants_empty_inputs(muc1_ref):
+    assert preprocessing_variants(pd.DataFrame(), pd.DataFrame(), muc1_ref).empty
+
+
+def _sort_and_dedup(df, columns):
+    """
+    Reference implementation: stable descending sort by `columns`, first
+    row per ALT, returned in the original row order.
+    """
+    kept = df.sort_values(
+        columns, ascending=[False] * len(columns), kind="stable"
+    ).drop_duplicates("ALT", keep="first")
+    return kept.sort_index()
+
+
+@pytest.mark.parametrize(
+    "columns",
+    [["Depth_Score", "POS"], ["Depth_Score"]],
+    ids=["left_branch", "right_branch"],
+)
+@pytest.mark.parametrize(
+    "rows",
+    [
+        pytest.param(
+            [("C", 0.5, 10), ("C", 0.7, 5), ("G", 0.1, 3), ("G", 0.2, 1)],
+            id="distinct_scores",
+        ),
+        pytest.param(
+            [("C", 0.5, 10), ("C", 0.5, 30), ("C", 0.5, 20), ("G", 0.3, 4)],
+            id="depth_score_ties",
+        ),
+        pytest.param(
+            [("C", 0.5, 10), ("C", 0.5, 10), ("C", 0.4, 99)],
+            id="full_ties",
+        ),
+        pytest.param(
+            [("C", np.nan, 50), ("C", 0.1, 1), ("G", np.nan, 2), ("G", np.nan, 7)],
+            id="nan_scores",
+        ),
+        pytest.param([("T", 0.9, 42)], id="single_row"),
+        pytest.param(
+            [("C", 0.2, 1), ("A", 0.9, 2), ("T", 0.3, 3), ("C", 0.2, 4)],
+            id="single_row_groups",
+        ),
+    ],
+)
+def test_best_row_per_alt_matches_sort_and_dedup(rows, columns):
+    """
+    Same rows (by index) as the sort + drop_duplicates it replaces, for the
+    left branch (Depth_Score, then POS) and the right branch (Depth_Score).
+    """
+    df = pd.DataFrame(rows, columns=["ALT", "Depth_Score", "POS"])
+    df.index = df.index * 10 + 3  # a non-default index must be preserved
+    result = _best_row_per_alt(df, columns)
+    expected = _sort_and_dedup(df, columns)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_best_row_per_alt_pos_breaks_ties_on_left_branch():
+    """
+    With equal Depth_Score the left branch keeps the larger POS, while the
+    right branch keeps the earliest row.
+    """
+    df = pd.DataFrame(
+        {"ALT": ["C", "C", "C"], "Depth_Score": [0.5, 0.5, 0.1], "POS": [10, 30, 50]}
+    )
+    assert _best_row_per_alt(df, ["Depth_Score", "POS"])["POS"].tolist() == [30]
+    assert _best_row_per_alt(df, ["Depth_Score"])["POS"].tolist() == [10]
+
+
+def test_best_row_per_alt_random_frames():
+    """
+    Random frames with many ties and NaN scores agree with the reference.
+    """
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        n = int(rng.integers(1, 40))
+        scores = rng.choice([0.1, 0.2, 0.3, np.nan], size=n)
+        df = pd.DataFrame(
+            {
+                "ALT": rng.choice(["C", "G", "GG", "T"], size=n),
+                "Depth_Score": scores,
+                "POS": rng.integers(0, 5, size=n),
+            }
+        )
+        for columns in (["Depth_Score", "POS"], ["Depth_Score"]):
+            pd.testing.assert_frame_equal(
+                _best_row_per_alt(df, columns), _sort_and_dedup(df, columns)
+            )
@@ -3,13 +3,16 @@
 
 """
 Unit tests for utility functions.
-Includes testing for command execution and BAM file validation.
+Includes testing for command execution, BAM file validation and TSV reading.
 """
 
+import sys
+
 import pytest
+import pandas as pd
 from unittest.mock import patch, MagicMock
 from pathlib import Path
-from vntyper.scripts.utils import run_command, validate_bam_file
+from vntyper.scripts.utils import read_tsv, run_command, validate_bam_file
 
 
 def test_run_command_success(tmp_path):
@@ -63,3 +66,108 @@ def test_validate_bam_file_nonexistent():
     assert "does not exist" in str(
         exc.value
     ), "Expected ValueError for nonexistent file."
+
+
+ADVNTR_TSV = (
+    "# adVNTR genotyping output\n"
+    "# Reference: MUC1 VNTR\n"
+    "#VID\tState\tNumberOfSupportingReads\tMeanCoverage\tPvalue\n"
+    "25561\tI22_2_G_LEN1\t11\t143.5\t1.2e-06\n"
+    "25561\tD1_3_C_LEN1\t3\t143.5\t0.02\n"
+)
+
+HEADER_TSV = (
+    "## VNtyper Kestrel results\n"
+    "## version 2\n"
+    "Motif\tPOS\tDepth_Score\tConfidence\n"
+    "X-Y\t67\t0.015\tHigh_Precision\n"
+    "A-B\t68\t0.002\tLow_Precision\n"
+)
+
+
+@pytest.fixture(params=["pyarrow", "pandas"])
+def tsv_backend(request, monkeypatch):
+    """
+    Runs a test with read_tsv's pyarrow reader and with its pandas fallback
+    (pyarrow made unimportable).
+    """
+    if request.param == "pyarrow":
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+    return request.param
+
+
+def _advntr_columns(path):
+    # Leading comment lines and the "#VID" header, as process_advntr_output reads them
+    n_comments = 0
+    names = None
+    with open(path) as f:
+        for line in f:
+            if not line.startswith("#"):
+                break
+            n_comments += 1
+            if line.startswith("#VID"):
+                names = line[1:].rstrip("\r\n").split("\t")
+    return names, n_comments
+
+
+def test_read_tsv_advntr_vid_header(tmp_path, tsv_backend):
+    """
+    An adVNTR file: comment lines, the column names on the "#VID" line and
+    no header row; the columns are passed with names= and skip_rows=.
+    """
+    path = tmp_path / "output_adVNTR.vcf"
+    path.write_text(ADVNTR_TSV)
+    names, n_comments = _advntr_columns(path)
+
+    df = read_tsv(str(path), names=names, skip_rows=n_comments)
+
+    expected = pd.DataFrame(
+        {
+            "VID": [25561, 25561],
+            "State": ["I22_2_G_LEN1", "D1_3_C_LEN1"],
+            "NumberOfSupportingReads": [11, 3],
+            "MeanCoverage": [143.5, 143.5],
+            "Pvalue": [1.2e-06, 0.02],
+        }
+    )
+    pd.testing.assert_frame_equal(df, expected)
+
+
+@pytest.mark.parametrize("skip_rows", [None, 2])
+def test_read_tsv_header_row(tmp_path, tsv_backend, skip_rows):
+    """
+    A file whose column names are on the first non-comment line, with the
+    comment lines counted by read_tsv or passed in by the caller.
+    """
+    path = tmp_path / "kestrel_result.tsv"
+    path.write_text(HEADER_TSV)
+
+    df = read_tsv(str(path), skip_rows=skip_rows)
+
+    expected = pd.DataFrame(
+        {
+            "Motif": ["X-Y", "A-B"],
+            "POS": [67, 68],
+            "Depth_Score": [0.015, 0.002],
+            "Confidence": ["High_Precision", "Low_Precision"],
+        }
+    )
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_read_tsv_backends_agree(tmp_path, monkeypatch):
+    """
+    The pyarrow reader and the pandas fallback return the same frame.
+    """
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "output_adVNTR.vcf"
+    path.write_text(ADVNTR_TSV)
+    names, n_comments = _advntr_columns(path)
+
+    with_pyarrow = read_tsv(str(path), names=names, skip_rows=n_comments)
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with_pandas = read_tsv(str(path), names=names, skip_rows=n_comments)
+
+    pd.testing.assert_frame_equal(with_pyarrow, with_pandas)
@@ -13,6 +13,7 @@ Ensures that ALT-based filtering rules are correctly applied:
 
 import pytest
 import pandas as pd
+from vntyper.scripts import variant_parsing
 from vntyper.scripts.variant_parsing import filter_by_alt_values_and_finalize
 
 
@@ -127,3 +128,19 @@ def test_filter_by_alt_values_drop_left_right(kestrel_config_mock):
     assert (
         "left" not in out.columns and "right" not in out.columns
     ), "Expected the 'left' and 'right' columns to be dropped."
+
+
+@pytest.mark.parametrize("first_error", [ImportError, TypeError])
+def test_vcf_string_dtype_without_pyarrow(monkeypatch, first_error):
+    """
+    Without pyarrow the string dtype must fall back to object columns,
+    whichever spelling (pandas >= 2.3 or "pyarrow_numpy") is attempted.
+    """
+
+    def fake_string_dtype(storage=None, na_value=None):
+        if storage == "pyarrow" and first_error is TypeError:
+            raise TypeError("unexpected keyword argument 'na_value'")
+        raise ImportError("pyarrow is required")
+
+    monkeypatch.setattr(variant_parsing.pd, "StringDtype", fake_string_dtype)
+    assert variant_parsing._vcf_string_dtype() is object
@@ -9,17 +9,12 @@ import logging
 import sys
 from pathlib import Path
 
-from vntyper.scripts.cohort_summary import aggregate_cohort
-from vntyper.scripts.fastq_bam_processing import process_bam_to_fastq, process_fastq
-from vntyper.scripts.generate_report import generate_summary_report
-from vntyper.scripts.install_references import main as install_references_main
-from vntyper.scripts.kestrel_genotyping import run_kestrel
-from vntyper.scripts.pipeline import run_pipeline
 from vntyper.scripts.utils import setup_logging
 from vntyper.version import __version__ as VERSION
 
-# Import the online mode function
-from vntyper.scripts.online_mode import run_online_mode
+# Subcommand handlers (pipeline, report, cohort, install-references, online)
+# are imported lazily inside their branches of main(), so that e.g.
+# `vntyper --help` does not pay for importing pandas, jinja2, plotly, etc.
 
 
 def load_config(config_path=None):
@@ -49,56 +44,40 @@ def load_config(config_path=None):
     return config
 
 
-def main():
+def _run_options_parser():
     """
-    Main function to parse arguments and execute corresponding subcommands.
-    With this setup, global parameters can now be placed before or after
-    the subcommand.
+    Parent parser with the run options shared by `pipeline` and `online`:
+    -o/--output-dir, --threads and --reference-assembly.
     """
-
-    # Parent parser for global arguments
-    parent_parser = argparse.ArgumentParser(add_help=False, conflict_handler="resolve")
-    parent_parser.add_argument(
-        "-l",
-        "--log-level",
-        help="Set the logging level (e.g., DEBUG, INFO, WARNING, ERROR)",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-    )
-    parent_parser.add_argument(
-        "-f", "--log-file", help="Set the log output file (default is stdout)"
+    run_options = argparse.ArgumentParser(add_help=False)
+    run_options.add_argument(
+        "-o",
+        "--output-dir",
+        type=str,
+        default=None,
+        help="Output directory for the results.",
     )
-    parent_parser.add_argument(
-        "-v", "--version", action="version", version=f"%(prog)s {VERSION}"
+    run_options.add_argument(
+        "--threads", type=int, default=None, help="Number of threads to use."
     )
-    parent_parser.add_argument(
-        "--config-path",
-        type=Path,
+    run_options.add_argument(
+        "--reference-assembly",
+        type=str,
+        choices=["hg19", "hg38"],
         default=None,
-        help=(
-            "Path to the configuration file (config.json). "
-            "If not provided, the default config will be used."
-        ),
-        required=False,
-    )
-
-    # Main parser that includes the parent parser
-    parser = argparse.ArgumentParser(
-        description="VNtyper CLI: A pipeline for genotyping MUC1-VNTR.",
-        parents=[parent_parser],
+        help="Specify the reference assembly used for the input "
+        "BAM/CRAM file alignment.",
     )
+    return run_options
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Subcommand: pipeline
+def _add_pipeline_parser(subparsers):
+    """Add the `pipeline` subcommand (full VNtyper pipeline)."""
     parser_pipeline = subparsers.add_parser(
-        "pipeline", help="Run the full VNtyper pipeline.", conflict_handler="resolve"
-    )
-    parser_pipeline.add_argument(
-        "-o",
-        "--output-dir",
-        type=str,
-        default=None,
-        help="Output directory for the results.",
+        "pipeline",
+        help="Run the full VNtyper pipeline.",
+        parents=[_run_options_parser()],
+        conflict_handler="resolve",
     )
     # Changed here (#57): allow --extra-modules multiple times
     parser_pipeline.add_argument(
@@ -116,17 +95,6 @@ def main():
     )
     parser_pipeline.add_argument("--bam", type=str, help="Path to the BAM file.")
     parser_pipeline.add_argument("--cram", type=str, help="Path to the CRAM file.")
-    parser_pipeline.add_argument(
-        "--threads", type=int, default=None, help="Number of threads to use."
-    )
-    parser_pipeline.add_argument(
-        "--reference-assembly",
-        type=str,
-        choices=["hg19", "hg38"],
-        default=None,
-        help="Specify the reference assembly used for the input "
-        "BAM/CRAM file alignment.",
-    )
     parser_pipeline.add_argument(
         "--fast-mode",
         action="store_true",
@@ -192,7 +160,9 @@ def main():
         help="Max coverage (e.g. 300) for quick adVNTR mode.",
     )
 
-    # Subcommand: report
+
+def _add_report_parser(subparsers):
+    """Add the `report` subcommand (summary report from pipeline output)."""
     parser_report = subparsers.add_parser(
         "report",
         help="Generate a summary report and visualizations from output data.",
@@ -232,7 +202,9 @@ def main():
         help="Flanking region size for IGV reports.",
     )
 
-    # Subcommand: cohort
+
+def _add_cohort_parser(subparsers):
+    """Add the `cohort` subcommand (aggregate multiple runs)."""
     parser_cohort = subparsers.add_parser(
         "cohort",
         help="Aggregate outputs from multiple runs into a single summary file.",
@@ -264,7 +236,9 @@ def main():
         help="Name of the cohort summary report file.",
     )
 
-    # Subcommand: install-references
+
+def _add_install_references_parser(subparsers):
+    """Add the `install-references` subcommand."""
     parser_install = subparsers.add_parser(
         "install-references",
         help="Download and set up necessary reference files.",
@@ -281,35 +255,21 @@ def main():
         "--skip-indexing", action="store_true", help="Skip the bwa indexing step."
     )
 
-    # Subcommand: online
+
+def _add_online_parser(subparsers):
+    """Add the `online` subcommand (submit to an online vntyper instance)."""
     parser_online = subparsers.add_parser(
         "online",
         help=(
             "Subset the BAM and submit it to an online vntyper instance, "
             "then retrieve results."
         ),
+        parents=[_run_options_parser()],
         conflict_handler="resolve",
     )
     parser_online.add_argument(
         "--bam", type=str, required=True, help="Path to the input BAM file."
     )
-    parser_online.add_argument(
-        "-o",
-        "--output-dir",
-        type=str,
-        default=None,
-        help="Output directory for results.",
-    )
-    parser_online.add_argument(
-        "--reference-assembly",
-        type=str,
-        choices=["hg19", "hg38"],
-        default=None,
-        help="Reference assembly used.",
-    )
-    parser_online.add_argument(
-        "--threads", type=int, default=None, help="Number of threads to use."
-    )
     parser_online.add_argument(
         "--email",
         type=str,
@@ -334,6 +294,111 @@ def main():
         help="Resume polling a previously submitted job if job_id is found.",
     )
 
+
+# Subcommand name -> function adding its subparser, in help display order
+SUBCOMMAND_PARSERS = {
+    "pipeline": _add_pipeline_parser,
+    "report": _add_report_parser,
+    "cohort": _add_cohort_parser,
+    "install-references": _add_install_references_parser,
+    "online": _add_online_parser,
+}
+
+
+class _SubcommandSniffError(Exception):
+    """Raised by _SubcommandSniffer instead of printing an error and exiting."""
+
+
+class _SubcommandSniffer(argparse.ArgumentParser):
+    """Parser for the global options only, used by _requested_subcommand()."""
+
+    def error(self, message):
+        raise _SubcommandSniffError(message)
+
+
+def _global_options_parser():
+    """
+    Parent parser with the global options, accepted before or after the
+    subcommand.
+    """
+    parent_parser = argparse.ArgumentParser(add_help=False, conflict_handler="resolve")
+    parent_parser.add_argument(
+        "-l",
+        "--log-level",
+        help="Set the logging level (e.g., DEBUG, INFO, WARNING, ERROR)",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+    )
+    parent_parser.add_argument(
+        "-f", "--log-file", help="Set the log output file (default is stdout)"
+    )
+    parent_parser.add_argument(
+        "-v", "--version", action="version", version=f"%(prog)s {VERSION}"
+    )
+    parent_parser.add_argument(
+        "--config-path",
+        type=Path,
+        default=None,
+        help=(
+            "Path to the configuration file (config.json). "
+            "If not provided, the default config will be used."
+        ),
+        required=False,
+    )
+    return parent_parser
+
+
+def _requested_subcommand(argv):
+    """
+    Returns the subcommand named on the command line, or None.
+
+    Only global options can precede the subcommand, so argparse parses
+    `argv` with just those options (including their values and
+    abbreviations) and the subcommand is the first remaining argument,
+    e.g. `report` in `vntyper -l DEBUG report ...` but not in
+    `vntyper -f report pipeline ...`. None if that argument is not a
+    known subcommand or the global options do not parse.
+    """
+    # A fresh copy of the global options: replacing --version below must
+    # not touch the actions shared with the real parser.
+    sniffer = _SubcommandSniffer(
+        add_help=False, parents=[_global_options_parser()], conflict_handler="resolve"
+    )
+    # Only detect --version here; the real parser prints it and exits.
+    sniffer.add_argument("-v", "--version", action="store_true")
+    try:
+        _, remaining = sniffer.parse_known_args(argv)
+    except _SubcommandSniffError:
+        return None
+    if remaining and remaining[0] in SUBCOMMAND_PARSERS:
+        return remaining[0]
+    return None
+
+
+def main():
+    """
+    Main function to parse arguments and execute corresponding subcommands.
+    With this setup, global parameters can now be placed before or after
+    the subcommand.
+    """
+
+    # Parent parser for global arguments
+    parent_parser = _global_options_parser()
+
+    # Main parser that includes the parent parser
+    parser = argparse.ArgumentParser(
+        description="VNtyper CLI: A pipeline for genotyping MUC1-VNTR.",
+        parents=[parent_parser],
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # Only build the subparser that was actually requested; all of them are
+    # built when no known subcommand is given (e.g. `vntyper --help`).
+    requested = _requested_subcommand(sys.argv[1:])
+    for name, add_parser in SUBCOMMAND_PARSERS.items():
+        if requested is None or name == requested:
+            add_parser(subparsers)
+
     # Parse all arguments first
     args = parser.parse_args()
 
@@ -407,6 +472,8 @@ def main():
 
     # Subcommand: install-references
     if args.command == "install-references":
+        from vntyper.scripts.install_references import main as install_references_main
+
         install_references_main(
             output_dir=args.output_dir,
             config_path=args.config_path,
@@ -524,6 +591,8 @@ def main():
                 sample_name_val = "sample"
                 logging.debug(f"sample_name defaulted to: {sample_name_val}")
 
+        from vntyper.scripts.pipeline import run_pipeline
+
         run_pipeline(
             bwa_reference=bwa_reference,
             output_dir=Path(args.output_dir),
@@ -590,6 +659,8 @@ def main():
                 logging.debug(f"bed_file set to {args.bed_file}")
 
         # Now call generate_summary_report
+        from vntyper.scripts.generate_report import generate_summary_report
+
         generate_summary_report(
             output_dir=Path(args.output_dir),
             template_dir=config.get("paths", {}).get(
@@ -635,6 +706,8 @@ def main():
                 input_paths.extend(file_lines)
             logging.debug(f"Added input_file entries: {file_lines}")
 
+        from vntyper.scripts.cohort_summary import aggregate_cohort
+
         aggregate_cohort(
             input_paths=input_paths,
             output_dir=Path(args.output_dir),
@@ -660,6 +733,8 @@ def main():
             args.threads = get_conf("threads", 4)
             logging.debug(f"threads set to {args.threads}")
 
+        from vntyper.scripts.online_mode import run_online_mode
+
         run_online_mode(
             config=config,
             bam=args.bam,
@@ -10,7 +10,7 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
-from vntyper.scripts.utils import run_command, load_config
+from vntyper.scripts.utils import run_command, load_config, read_tsv
 
 # -------------------------------------------------------------------------
 # Configure logging
@@ -319,9 +319,6 @@ def process_advntr_output(output_path, output, output_name, config=None):
 
     logging.info("Processing adVNTR result...")
 
-    with open(output_path, "r") as file:
-        content = file.readlines()
-
     default_columns_advntr_output = [
         "#VID",
         "State",
@@ -330,16 +327,23 @@ def process_advntr_output(output_path, output, output_name, config=None):
         "Pvalue",
     ]
 
-    content = [
-        line.replace("#VID", "VID") if line.startswith("#VID") else line
-        for line in content
-    ]
-    with open(output_path, "w") as file:
-        file.writelines(content)
+    # adVNTR writes its header as a "#VID ..." comment line. Take the column
+    # names from it while scanning the leading comment lines, then parse the
+    # data rows in one read instead of rewriting the file first. Without such
+    # a line, the first non-comment line is the header.
+    column_names = None
+    n_comments = 0
+    with open(output_path, "r") as file:
+        for line in file:
+            if not line.startswith("#"):
+                break
+            n_comments += 1
+            if line.startswith("#VID"):
+                column_names = line[1:].rstrip("\r\n").split("\t")
 
     try:
         logging.info("Loading data into DataFrame...")
-        df = pd.read_csv(output_path, sep="\t", comment="#")
+        df = read_tsv(output_path, names=column_names, skip_rows=n_comments)
         logging.info(f"Data loaded successfully with shape: {df.shape}")
         logging.debug(f"First few rows of the DataFrame:\n{df.head()}")
     except Exception as e:
@@ -5,9 +5,12 @@ import logging
 from pathlib import Path
 from typing import Optional
 
+import hashlib
 import json
+import os
+import shutil
+import subprocess as sp
 import importlib.resources as pkg_resources
-from vntyper.scripts.utils import run_command
 
 
 def check_bwa_index(reference: Path) -> bool:
@@ -31,11 +34,18 @@ def check_bwa_index(reference: Path) -> bool:
         "bwa_index_extensions", [".amb", ".ann", ".bwt", ".pac", ".sa"]
     )
 
+    # One directory listing instead of a stat() per index file; DirEntry.is_file()
+    # only needs an extra stat for symlinks.
     reference = Path(reference)
+    try:
+        with os.scandir(reference.parent) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        present = set()
     missing_files = [
         reference.with_name(reference.name + ext)
         for ext in required_extensions
-        if not reference.with_name(reference.name + ext).exists()
+        if reference.name + ext not in present
     ]
 
     if missing_files:
@@ -48,6 +58,87 @@ def check_bwa_index(reference: Path) -> bool:
     return True
 
 
+def alignment_cache_key(
+    fastq1: Path,
+    fastq2: Path,
+    reference: Path,
+    bwa_path: Path,
+    samtools_path: Path,
+    fastp_path: Optional[Path] = None,
+) -> Optional[str]:
+    """
+    Compute a key identifying the inputs of an alignment run.
+
+    The key covers the reference and FASTQ paths with their modification times,
+    and the resolved bwa/samtools executables with theirs, so replacing any
+    input or upgrading either tool invalidates a previous result. When the
+    reads are streamed through fastp (bam_processing.fastp_prefetch), the
+    fastp executable is part of the key as well. The thread count does not
+    affect the output and is not part of the key.
+
+    Args:
+        fastq1 (Path): Path to the first FASTQ file.
+        fastq2 (Path): Path to the second FASTQ file.
+        reference (Path): Path to the reference genome in FASTA format.
+        bwa_path (Path): Configured BWA executable.
+        samtools_path (Path): Configured Samtools executable.
+        fastp_path (Optional[Path]): Configured fastp executable if the reads
+            are streamed through fastp, else None.
+
+    Returns:
+        Optional[str]: Hex digest of the inputs, or None if any of them cannot be stat'ed.
+    """
+    parts = []
+    try:
+        for path in (reference, fastq1, fastq2):
+            parts.append(f"{os.path.abspath(path)}:{os.stat(path).st_mtime_ns}")
+        for tool in (bwa_path, samtools_path):
+            resolved = shutil.which(str(tool)) or str(tool)
+            parts.append(f"{resolved}:{os.stat(resolved).st_mtime_ns}")
+        if fastp_path is not None:
+            resolved = shutil.which(str(fastp_path)) or str(fastp_path)
+            parts.append(f"fastp {resolved}:{os.stat(resolved).st_mtime_ns}")
+    except OSError:
+        return None
+    return hashlib.blake2b("\n".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def run_piped_commands(commands: list, log_handle) -> Optional[list]:
+    """
+    Run commands as a pipeline, each one's stdout feeding the next one's stdin.
+
+    Args:
+        commands (list): Argument lists, in pipeline order.
+        log_handle: Open file that receives the stderr of every command.
+
+    Returns:
+        Optional[list]: Exit codes of the commands in order, or None if one of
+            them could not be launched.
+    """
+    procs = []
+    for i, command in enumerate(commands):
+        try:
+            proc = sp.Popen(
+                command,
+                stdin=procs[-1].stdout if procs else None,
+                stdout=sp.PIPE if i < len(commands) - 1 else None,
+                stderr=log_handle,
+            )
+        except OSError as e:
+            logging.error(f"Failed to launch {command[0]}: {e}")
+            for started in procs:
+                started.kill()
+                started.wait()
+            return None
+        if procs:
+            # Close our copy so the upstream process gets SIGPIPE if this exits early
+            procs[-1].stdout.close()
+        procs.append(proc)
+    # Wait on the last stage first; upstream stages finish once it stops reading.
+    returncodes = [proc.wait() for proc in reversed(procs)]
+    return returncodes[::-1]
+
+
 def align_and_sort_fastq(
     fastq1: Path,
     fastq2: Path,
@@ -61,10 +152,16 @@ def align_and_sort_fastq(
     Align FASTQ files to the reference genome using BWA, then sort and convert to BAM using Samtools.
 
     This function performs the following steps:
-    1. Checks for the existence of BWA index files for the reference genome.
-    2. Aligns paired-end FASTQ files to the reference genome using BWA MEM.
-    3. Pipes the alignment output to Samtools for conversion to BAM format and sorting.
-    4. Indexes the resulting sorted BAM file.
+    1. Returns the existing sorted BAM early if its `.causal` sidecar matches
+       the current inputs (see alignment_cache_key).
+    2. Checks for the existence of BWA index files for the reference genome.
+    3. Aligns paired-end FASTQ files to the reference genome using BWA MEM;
+       gzipped input is decompressed by fastp and streamed into BWA when
+       bam_processing.fastp_prefetch is enabled.
+    4. Pipes the alignment output directly into Samtools sort, which writes
+       the sorted BAM and its index in one pass (--write-index; no
+       intermediate SAM or unsorted BAM on disk).
+    5. Records the input key next to the BAM.
 
     Args:
         fastq1 (Path): Path to the first FASTQ file.
@@ -89,6 +186,38 @@ def align_and_sort_fastq(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     sorted_bam_out = output_dir / f"{output_name}_sorted.bam"
+    index_file = sorted_bam_out.with_suffix(".bam.bai")
+
+    fastp_path = config["tools"].get("fastp")
+    prefetch = bool(
+        config.get("bam_processing", {}).get("fastp_prefetch", False)
+        and fastp_path
+        and str(fastq1).endswith(".gz")
+    )
+
+    # Skip the alignment entirely if a previous run with identical inputs left
+    # its sorted BAM, index and matching .causal sidecar behind.
+    cache_key = alignment_cache_key(
+        fastq1,
+        fastq2,
+        reference,
+        bwa_path,
+        samtools_path,
+        fastp_path if prefetch else None,
+    )
+    causal_file = sorted_bam_out.with_name(sorted_bam_out.name + ".causal")
+    if cache_key is not None and sorted_bam_out.exists() and index_file.exists():
+        try:
+            if causal_file.read_text().strip() == cache_key:
+                logging.info(
+                    f"Sorted BAM {sorted_bam_out} is up to date with its inputs; "
+                    f"skipping alignment."
+                )
+                return str(sorted_bam_out)
+        except OSError:
+            pass
+    # Remove any stale sidecar so an interrupted run is never considered current.
+    causal_file.unlink(missing_ok=True)
 
     if not check_bwa_index(reference):
         logging.error(
@@ -97,19 +226,76 @@ def align_and_sort_fastq(
         )
         return None
 
-    bwa_command = f"{bwa_path} mem -t {threads} {reference} {fastq1} {fastq2}"
-
-    samtools_view_sort_command = (
-        f"{config['tools']['samtools']} view -@ {threads} -b | "
-        f"{config['tools']['samtools']} sort -@ {threads} -o {sorted_bam_out}"
+    # bwa mem streams SAM straight into samtools sort, which also writes the
+    # .bai (samtools >= 1.10); no intermediate SAM/BAM is written and no shell
+    # is involved.
+    bwa_threads = sort_threads = threads
+    commands = []
+    if prefetch:
+        # Let fastp's multi-threaded reader decompress the gzipped FASTQs and
+        # stream them interleaved into bwa (-p), instead of bwa inflating both
+        # files itself. All fastp filtering, trimming and duplication
+        # evaluation is disabled, so the reads reaching bwa are unchanged.
+        # The three stages run at once, so they share the thread budget,
+        # most of it going to bwa.
+        fastp_threads = sort_threads = max(1, threads // 4)
+        bwa_threads = max(1, threads - fastp_threads - sort_threads)
+        commands.append(
+            [
+                str(fastp_path),
+                "--thread",
+                str(fastp_threads),
+                "--in1",
+                str(fastq1),
+                "--in2",
+                str(fastq2),
+                "--stdout",
+                "--disable_adapter_trimming",
+                "--disable_trim_poly_g",
+                "--disable_quality_filtering",
+                "--disable_length_filtering",
+                "--dont_eval_duplication",
+                "--json",
+                os.devnull,
+                "--html",
+                os.devnull,
+            ]
+        )
+    bwa_command = [str(bwa_path), "mem", "-t", str(bwa_threads)]
+    if prefetch:
+        bwa_command += ["-p", str(reference), "-"]
+    else:
+        bwa_command += [str(reference), str(fastq1), str(fastq2)]
+    commands.append(bwa_command)
+    commands.append(
+        [
+            str(samtools_path),
+            "sort",
+            "-@",
+            str(sort_threads),
+            "--write-index",
+            "-o",
+            f"{sorted_bam_out}##idx##{index_file}",
+            "-",
+        ]
     )
 
-    full_command = f"{bwa_command} | {samtools_view_sort_command}"
     log_file_alignment = output_dir / f"{output_name}_alignment.log"
-    logging.info(f"Executing alignment and sorting with command: {full_command}")
+    logging.info(
+        f"Executing alignment and sorting with command: "
+        f"{' | '.join(' '.join(command) for command in commands)}"
+    )
+
+    # All tools log to the same file; stderr is not piped back to us so a
+    # chatty bwa cannot fill a pipe buffer and stall the pipeline.
+    with open(log_file_alignment, "w") as lf:
+        returncodes = run_piped_commands(commands, lf)
 
-    if not run_command(str(full_command), str(log_file_alignment), critical=True):
-        logging.error("BWA alignment and Samtools sorting failed.")
+    if returncodes is None or any(returncodes):
+        logging.error(
+            f"BWA alignment and Samtools sorting failed "
+            f"(exit codes {returncodes}). Check {log_file_alignment} for details."
+        )
         return None
 
     if not sorted_bam_out.exists():
@@ -119,23 +305,17 @@ def align_and_sort_fastq(
         )
         return None
 
-    logging.info("BWA alignment and Samtools sorting completed successfully.")
-
-    logging.info(f"Indexing sorted BAM file: {sorted_bam_out}")
-    samtools_index_command = f"{samtools_path} index {sorted_bam_out}"
-    log_file_index = output_dir / f"{output_name}_index.log"
-
-    if not run_command(str(samtools_index_command), str(log_file_index), critical=True):
-        logging.error("Samtools indexing failed.")
-        return None
-
-    index_file = sorted_bam_out.with_suffix(".bam.bai")
     if not index_file.exists():
         logging.error(
             f"BAM index file {index_file} not created. "
-            f"Samtools indexing might have failed."
+            f"Samtools sort --write-index might have failed."
         )
         return None
 
-    logging.info("Samtools indexing completed successfully.")
+    logging.info("BWA alignment, Samtools sorting and indexing completed successfully.")
+    if cache_key is not None:
+        try:
+            causal_file.write_text(cache_key + "\n")
+        except OSError as e:
+            logging.warning(f"Could not write alignment cache key {causal_file}: {e}")
     return str(sorted_bam_out)
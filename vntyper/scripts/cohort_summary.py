@@ -12,55 +12,35 @@ Note: This module no longer defines its own CLI parser as these are now defined
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import zipfile
 import tempfile
 import shutil
 import json
-import base64
+import hashlib
+import math
+from html import escape
 
-import pandas as pd
-import matplotlib
-import matplotlib.pyplot as plt
-import plotly.express as px
-import plotly.io as pio
-from jinja2 import Environment, FileSystemLoader
-import plotly.graph_objects as go
+from vntyper.scripts.utils import get_jinja_env
 
-matplotlib.use("Agg")
+# pandas, plotly and jinja2 are imported inside the functions that
+# use them so that importing this module (e.g. from the CLI) stays cheap.
 
+# Version of the on-disk per-sample summary cache (see load_pipeline_summary_cached).
+SUMMARY_CACHE_VERSION = 1
 
-def encode_image_to_base64(image_path):
-    """
-    Encode an image file to a base64 string.
-
-    Parameters
-    ----------
-    image_path : str or Path
-        Path to the image file.
-
-    Returns
-    -------
-    str
-        Base64-encoded string of the image.
-    """
-    try:
-        with open(image_path, "rb") as image_file:
-            encoded_string = base64.b64encode(image_file.read()).decode("utf-8")
-        return f"data:image/png;base64,{encoded_string}"
-    except Exception as e:
-        logging.error(f"Failed to encode image {image_path}: {e}")
-        return ""
+# Kestrel confidence labels highlighted in red in the cohort table.
+_HIGH_PRECISION_LABELS = frozenset({"High_Precision", "High_Precision*"})
 
 
-def generate_donut_chart(
-    values, labels, total, title, colors, plot_path=None, interactive=False
-):
+def generate_donut_chart(values, labels, total, title, colors, interactive=False):
     """
-    Generate and save a donut chart (static or interactive).
+    Generate a donut chart (static or interactive).
 
-    For static plots, matplotlib is used. For interactive plots, Plotly is used.
+    Static charts are written directly as an inline SVG string, one stroked
+    circle per segment; interactive charts use Plotly.
     This chart visualizes categories as parts of a donut, with the total in the center.
 
     Parameters
@@ -75,20 +55,21 @@ def generate_donut_chart(
         Title of the chart.
     colors : list
         Colors for each segment of the donut.
-    plot_path : str or Path, optional
-        Path to save the static plot image.
     interactive : bool
         Whether to generate an interactive Plotly chart.
 
     Returns
     -------
     str
-        Base64-encoded image string for static charts or HTML string for interactive charts.
+        Inline SVG markup for static charts or HTML string for interactive charts.
     """
     if sum(values) == 0:
         logging.warning(f"No data to plot for donut chart '{title}'.")
         return ""
     if interactive:
+        import plotly.graph_objects as go
+        import plotly.io as pio
+
         fig = go.Figure(
             go.Pie(
                 labels=labels,
@@ -117,32 +98,42 @@ def generate_donut_chart(
             width=500,
         )
         return pio.to_html(fig, full_html=False)
-    else:
-        fig, ax = plt.subplots(figsize=(6, 6))
-        wedgeprops = {"width": 0.3, "edgecolor": "black", "linewidth": 2}
-        try:
-            ax.pie(
-                values,
-                wedgeprops=wedgeprops,
-                startangle=90,
-                colors=colors,
-                labels=labels,
-            )
-            ax.text(0, 0, f"{total}", ha="center", va="center", fontsize=24)
-            ax.set_title(title)
-            if plot_path:
-                plt.savefig(plot_path)
-            else:
-                logging.warning(
-                    "No plot_path provided for static donut chart, chart not saved."
-                )
-        except Exception as e:
-            logging.error(f"Error generating donut chart: {e}")
-        plt.close()
-        if plot_path and os.path.exists(plot_path):
-            return encode_image_to_base64(plot_path)
-        else:
-            return ""
+
+    # Each segment is a circle whose stroke is dashed to the segment's share of
+    # the circumference and rotated to start where the previous one ended.
+    radius = 120
+    circumference = 2 * math.pi * radius
+    value_sum = sum(values)
+    parts = [
+        '<svg xmlns="http://www.w3.org/2000/svg" width="400" height="400" '
+        f'viewBox="0 0 400 400" role="img" aria-label="{escape(title)}">',
+        f'<text x="200" y="30" text-anchor="middle" font-size="20">{escape(title)}</text>',
+    ]
+    offset = 0.0
+    for value, label, color in zip(values, labels, colors):
+        if value <= 0:
+            continue
+        length = circumference * value / value_sum
+        parts.append(
+            f'<circle cx="200" cy="200" r="{radius}" fill="none" stroke="{color}" '
+            f'stroke-width="45" stroke-dasharray="{length:.2f} {circumference:.2f}" '
+            f'stroke-dashoffset="{-offset:.2f}" transform="rotate(-90 200 200)">'
+            f"<title>{escape(str(label))}: {value}</title></circle>"
+        )
+        offset += length
+    parts.append(
+        f'<text x="200" y="200" text-anchor="middle" dominant-baseline="central" '
+        f'font-size="40" font-weight="bold">{total}</text>'
+    )
+    legend_x = 200 - 60 * len(labels)
+    for i, (label, color) in enumerate(zip(labels, colors)):
+        x = legend_x + 120 * i
+        parts.append(
+            f'<rect x="{x}" y="360" width="14" height="14" fill="{color}"/>'
+            f'<text x="{x + 20}" y="372" font-size="14">{escape(str(label))}</text>'
+        )
+    parts.append("</svg>")
+    return "".join(parts)
 
 
 def load_report_config():
@@ -297,6 +288,28 @@ def compute_algorithm_result(df, logic_config):
     return logic_config.get("default", "none")
 
 
+def iter_table_rows(df):
+    """
+    Yield the rows of a DataFrame one at a time for streamed HTML rendering.
+
+    Missing values are shown as "NaN", matching DataFrame.to_html().
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Table to render.
+
+    Yields
+    ------
+    tuple
+        The cell values of one row, in column order.
+    """
+    import pandas as pd
+
+    for row in df.itertuples(index=False, name=None):
+        yield tuple("NaN" if pd.isna(value) else value for value in row)
+
+
 def generate_cohort_summary_report(
     output_dir, kestrel_df, advntr_df, summary_file, config
 ):
@@ -324,8 +337,7 @@ def generate_cohort_summary_report(
     None
         Writes the HTML report to the specified summary file.
     """
-    plots_dir = Path(output_dir) / "plots"
-    plots_dir.mkdir(parents=True, exist_ok=True)
+    import pandas as pd
 
     # Load report-specific config to get algorithm logic
     report_cfg = load_report_config()
@@ -334,38 +346,41 @@ def generate_cohort_summary_report(
 
     # Group results by sample and compute per-sample algorithm result.
     if not kestrel_df.empty and "Sample" in kestrel_df.columns:
-        kestrel_sample_results = kestrel_df.groupby("Sample").apply(
+        kestrel_sample_results = kestrel_df.groupby("Sample", observed=True).apply(
             lambda g: compute_algorithm_result(g, kestrel_logic)
         )
     else:
         kestrel_sample_results = pd.Series(dtype=str)
 
     if not advntr_df.empty and "Sample" in advntr_df.columns:
-        advntr_sample_results = advntr_df.groupby("Sample").apply(
+        advntr_sample_results = advntr_df.groupby("Sample", observed=True).apply(
             lambda g: compute_algorithm_result(g, advntr_logic)
         )
     else:
         advntr_sample_results = pd.Series(dtype=str)
 
-    # Aggregate per-sample results for donut plots.
-    kestrel_positive = sum(
-        1
-        for r in kestrel_sample_results
-        if r
-        in [
-            "High_Precision",
-            "High_Precision_flagged",
-            "Low_Precision",
-            "Low_Precision_flagged",
-        ]
+    # Aggregate per-sample results for donut plots: one value_counts() pass
+    # per table instead of a separate scan for each category.
+    kestrel_counts = kestrel_sample_results.value_counts()
+    kestrel_positive = int(
+        kestrel_counts.reindex(
+            [
+                "High_Precision",
+                "High_Precision_flagged",
+                "Low_Precision",
+                "Low_Precision_flagged",
+            ],
+            fill_value=0,
+        ).sum()
     )
     kestrel_negative = len(kestrel_sample_results) - kestrel_positive
 
     if not advntr_df.empty:
-        advntr_positive = sum(
-            1 for r in advntr_sample_results if r in ["positive", "positive flagged"]
+        advntr_counts = advntr_sample_results.value_counts()
+        advntr_positive = int(
+            advntr_counts.reindex(["positive", "positive flagged"], fill_value=0).sum()
         )
-        advntr_negative = sum(1 for r in advntr_sample_results if r == "negative")
+        advntr_negative = int(advntr_counts.get("negative", 0))
         advntr_not_performed = 0
     else:
         advntr_positive = 0
@@ -384,14 +399,12 @@ def generate_cohort_summary_report(
         "no_data": color_list[2],
     }
 
-    kestrel_plot_path = plots_dir / "kestrel_summary_plot.png"
-    kestrel_plot_base64 = generate_donut_chart(
+    kestrel_plot_svg = generate_donut_chart(
         values=[kestrel_positive, kestrel_negative],
         labels=["Positive", "Negative"],
         total=total_kestrel,
         title="Kestrel Results",
         colors=[colors["positive"], colors["negative"]],
-        plot_path=kestrel_plot_path,
         interactive=False,
     )
     kestrel_plot_html = generate_donut_chart(
@@ -400,18 +413,15 @@ def generate_cohort_summary_report(
         total=total_kestrel,
         title="Kestrel Results",
         colors=[colors["positive"], colors["negative"]],
-        plot_path=None,
         interactive=True,
     )
 
-    advntr_plot_path = plots_dir / "advntr_summary_plot.png"
-    advntr_plot_base64 = generate_donut_chart(
+    advntr_plot_svg = generate_donut_chart(
         values=[advntr_positive, advntr_negative, advntr_not_performed],
         labels=["Positive", "Negative", "Not Performed"],
         total=total_advntr,
         title="adVNTR Results",
         colors=[colors["positive"], colors["negative"], colors["no_data"]],
-        plot_path=advntr_plot_path,
         interactive=False,
     )
     advntr_plot_html = generate_donut_chart(
@@ -420,7 +430,6 @@ def generate_cohort_summary_report(
         total=total_advntr,
         title="adVNTR Results",
         colors=[colors["positive"], colors["negative"], colors["no_data"]],
-        plot_path=None,
         interactive=True,
     )
 
@@ -432,7 +441,7 @@ def generate_cohort_summary_report(
                 if x == "Low_Precision"
                 else (
                     f'<span style="color:red;font-weight:bold;">{x}</span>'
-                    if x in ["High_Precision", "High_Precision*"]
+                    if x in _HIGH_PRECISION_LABELS
                     else x
                 )
             )
@@ -454,11 +463,6 @@ def generate_cohort_summary_report(
         "Flag",
     ]
     kestrel_columns = [col for col in desired_kestrel_cols if col in kestrel_df.columns]
-    kestrel_html = kestrel_df[kestrel_columns].to_html(
-        classes="table table-bordered table-striped hover compact order-column table-sm",
-        index=False,
-        escape=False,
-    )
 
     # Reorder advntr DataFrame columns: ensure Sample is first.
     desired_advntr_cols = [
@@ -475,44 +479,36 @@ def generate_cohort_summary_report(
         "Flag",
     ]
     advntr_columns = [col for col in desired_advntr_cols if col in advntr_df.columns]
-    advntr_html = advntr_df[advntr_columns].to_html(
-        classes="table table-bordered table-striped hover compact order-column table-sm",
-        index=False,
-        escape=False,
-    )
 
     template_dir = config.get("paths", {}).get("template_dir", "vntyper/templates")
-    env = Environment(loader=FileSystemLoader(template_dir))
     try:
-        template = env.get_template("cohort_summary_template.html")
+        template = get_jinja_env(template_dir).get_template("cohort_summary_template.html")
     except Exception as e:
         logging.error(f"Failed to load Jinja2 template: {e}")
         raise
 
     context = {
         "report_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "kestrel_positive": kestrel_html,
-        "advntr_positive": advntr_html,
-        "kestrel_plot_base64": kestrel_plot_base64,
-        "advntr_plot_base64": advntr_plot_base64,
+        # Tables are rendered row by row from generators while the template
+        # streams to disk, instead of building one big to_html() string each.
+        "kestrel_columns": kestrel_columns,
+        "kestrel_rows": iter_table_rows(kestrel_df[kestrel_columns]),
+        "advntr_columns": advntr_columns,
+        "advntr_rows": iter_table_rows(advntr_df[advntr_columns]),
+        "kestrel_plot_svg": kestrel_plot_svg,
+        "advntr_plot_svg": advntr_plot_svg,
         "kestrel_plot_interactive": kestrel_plot_html,
         "advntr_plot_interactive": advntr_plot_html,
         "interactive": True,
     }
 
-    try:
-        rendered_html = template.render(context)
-    except Exception as e:
-        logging.error(f"Failed to render the cohort summary template: {e}")
-        raise
-
     report_file_path = Path(output_dir) / summary_file
     try:
         with open(report_file_path, "w") as f:
-            f.write(rendered_html)
+            template.stream(context).dump(f)
         logging.info(f"Cohort summary report generated and saved to {report_file_path}")
     except Exception as e:
-        logging.error(f"Failed to write the cohort summary report: {e}")
+        logging.error(f"Failed to render or write the cohort summary report: {e}")
         raise
 
 
@@ -536,9 +532,6 @@ def load_pipeline_summary_for_sample(sample_dir):
     """
     sample_dir = Path(sample_dir)
     summary_path = sample_dir / "pipeline_summary.json"
-    if not summary_path.exists():
-        logging.warning(f"Pipeline summary file not found in {sample_dir}")
-        return [], []
     try:
         with open(summary_path, "r") as f:
             summary = json.load(f)
@@ -550,11 +543,222 @@ def load_pipeline_summary_for_sample(sample_dir):
             elif step.get("step") == "adVNTR Genotyping":
                 advntr_data = step.get("parsed_result", {}).get("data", [])
         return kestrel_data, advntr_data
+    except FileNotFoundError:
+        logging.warning(f"Pipeline summary file not found in {sample_dir}")
+        return [], []
     except Exception as e:
         logging.error(f"Error loading pipeline summary from {sample_dir}: {e}")
         return [], []
 
 
+def summary_cache_file(sample_dir, cache_dir):
+    """
+    Return the cache entry path for the pipeline summary in `sample_dir`,
+    keyed on the summary's resolved path, mtime and size (plus
+    SUMMARY_CACHE_VERSION), or None if the summary cannot be stat'ed.
+    """
+    summary_path = Path(sample_dir) / "pipeline_summary.json"
+    try:
+        st = summary_path.stat()
+    except OSError:
+        return None
+
+    key = hashlib.blake2b(
+        f"{SUMMARY_CACHE_VERSION}:{summary_path.resolve()}:"
+        f"{st.st_mtime_ns}:{st.st_size}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    return Path(cache_dir) / f"{key}.json"
+
+
+def prune_summary_cache(cache_dir, keep):
+    """
+    Delete the cache entries in `cache_dir` whose names are not in `keep`,
+    i.e. entries of samples that are not part of the current run or whose
+    summary has changed since, so the cache does not grow across runs.
+    """
+    try:
+        with os.scandir(cache_dir) as entries:
+            stale = [entry.path for entry in entries if entry.name not in keep]
+    except OSError:
+        return
+    for path in stale:
+        try:
+            os.remove(path)
+        except OSError as e:
+            logging.debug(f"Could not remove stale summary cache entry {path}: {e}")
+
+
+def load_pipeline_summary_cached(sample_dir, cache_dir):
+    """
+    Cached variant of load_pipeline_summary_for_sample().
+
+    The extracted Kestrel/adVNTR records are stored as a small JSON file in
+    `cache_dir`, keyed on the summary's resolved path, mtime and size (plus
+    SUMMARY_CACHE_VERSION). Re-running a cohort on unchanged samples then
+    skips parsing the full pipeline summaries. Bump SUMMARY_CACHE_VERSION
+    whenever the extracted structure changes to invalidate old entries.
+
+    Parameters
+    ----------
+    sample_dir : str or Path
+        Directory containing the pipeline_summary.json file.
+    cache_dir : str or Path
+        Directory holding the cache entries (created on demand).
+
+    Returns
+    -------
+    tuple
+        Two lists: (kestrel_data, advntr_data), as returned by
+        load_pipeline_summary_for_sample().
+    """
+    cache_file = summary_cache_file(sample_dir, cache_dir)
+    if cache_file is None:
+        logging.warning(f"Pipeline summary file not found in {sample_dir}")
+        return [], []
+
+    if cache_file.exists():
+        try:
+            with open(cache_file, "r") as f:
+                cached = json.load(f)
+            logging.debug(f"Using cached summary data for {sample_dir}")
+            return cached["kestrel"], cached["advntr"]
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable cache entry {cache_file}: {e}")
+
+    kestrel_data, advntr_data = load_pipeline_summary_for_sample(sample_dir)
+    # Empty results may stem from a read error, so only cache real data.
+    if kestrel_data or advntr_data:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump({"kestrel": kestrel_data, "advntr": advntr_data}, f)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logging.warning(f"Failed to write summary cache {cache_file}: {e}")
+    return kestrel_data, advntr_data
+
+
+def find_pipeline_summaries(root_dir, filename="pipeline_summary.json"):
+    """
+    Recursively find all files named `filename` below `root_dir`.
+
+    Uses an explicit stack of os.scandir() calls instead of Path.rglob, so each
+    directory is read once and entry types come from the cached DirEntry data
+    rather than an extra stat() per entry. Symlinked directories are not
+    followed.
+
+    Parameters
+    ----------
+    root_dir : str or Path
+        Directory to search.
+    filename : str
+        Exact file name to look for.
+
+    Returns
+    -------
+    list of Path
+        Paths of all matching files.
+    """
+    found = []
+    stack = [str(root_dir)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == filename:
+                        found.append(Path(entry.path))
+        except OSError as e:
+            logging.warning(f"Cannot scan directory {current}: {e}")
+    return found
+
+
+def collect_sample_dirs(root_dir, filename="pipeline_summary.json"):
+    """
+    Return the sample directories below `root_dir` that contain `filename`.
+
+    If `root_dir` itself holds the summary it is treated as a single sample
+    and its subfolders are not searched.
+
+    Parameters
+    ----------
+    root_dir : Path
+        Directory to search.
+    filename : str
+        Name of the pipeline summary file.
+
+    Returns
+    -------
+    list of Path
+        Sample directories (possibly empty).
+    """
+    if (root_dir / filename).is_file():
+        return [root_dir]
+    return [summary_path.parent for summary_path in find_pipeline_summaries(root_dir, filename)]
+
+
+def build_cohort_frame(sample_records):
+    """
+    Build one DataFrame from per-sample record lists, with a categorical
+    "Sample" column.
+
+    If pyarrow is available, each sample becomes a small string Arrow table
+    (pipeline summary values are all strings) and the tables are concatenated
+    once, with columns missing from a sample filled with nulls, before a single
+    conversion to pandas. Otherwise the records are passed to pandas directly.
+
+    Parameters
+    ----------
+    sample_records : list of tuple
+        (sample_id, records) pairs, where records is a non-empty list of dicts.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The combined table, or an empty DataFrame if there are no records.
+    """
+    import pandas as pd
+
+    if not sample_records:
+        return pd.DataFrame()
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        pa = None
+
+    df = None
+    if pa is not None:
+        try:
+            tables = []
+            for sample_id, records in sample_records:
+                names = list(dict.fromkeys(key for record in records for key in record))
+                arrays = [
+                    pa.array([record.get(name) for record in records], type=pa.string())
+                    for name in names
+                ]
+                arrays.append(pa.array([sample_id] * len(records), type=pa.string()))
+                tables.append(pa.table(arrays, names=names + ["Sample"]))
+            df = pa.concat_tables(tables, promote_options="default").to_pandas()
+        # pyarrow < 14 has no promote_options and raises TypeError.
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError) as e:
+            logging.debug(f"Falling back to pandas for cohort table: {e}")
+    if df is None:
+        df = pd.DataFrame(
+            [record for _, records in sample_records for record in records]
+        )
+        df["Sample"] = [
+            sample_id for sample_id, records in sample_records for _ in records
+        ]
+    # Move Sample to the last column, as categorical.
+    df["Sample"] = pd.Categorical(df.pop("Sample"))
+    return df
+
+
 def aggregate_cohort(input_paths, output_dir, summary_file, config):
     """
     Aggregate outputs from multiple runs into a single summary file.
@@ -582,49 +786,38 @@ def aggregate_cohort(input_paths, output_dir, summary_file, config):
         Writes the cohort summary report to the specified output directory.
     """
     temp_dirs = []
-    processed_dirs = set()  # use a set to avoid duplicate directories
+    # Sample directories keyed on their absolute path, so the same sample
+    # reached through different input paths is loaded only once.
+    processed_dirs = {}
+
+    def add_sample_dirs(sample_dirs):
+        for sample_dir in sample_dirs:
+            key = os.path.abspath(sample_dir)
+            if key not in processed_dirs:
+                logging.info(f"Found pipeline_summary.json in {sample_dir}")
+                processed_dirs[key] = Path(key)
 
     for path_str in input_paths:
         path = Path(path_str)
-        if not path.exists():
-            logging.warning(f"Input path does not exist and will be skipped: {path}")
-            continue
         if path.is_dir():
-            if (path / "pipeline_summary.json").exists():
-                logging.info(f"Found pipeline_summary.json in {path}")
-                processed_dirs.add(path)
-            else:
-                found = False
-                for summary_file_path in path.rglob("pipeline_summary.json"):
-                    sample_dir = summary_file_path.parent
-                    logging.info(f"Found pipeline_summary.json in {sample_dir}")
-                    processed_dirs.add(sample_dir)
-                    found = True
-                if not found:
-                    logging.warning(
-                        f"No pipeline_summary.json found in directory {path}"
-                    )
+            sample_dirs = collect_sample_dirs(path)
+            if not sample_dirs:
+                logging.warning(f"No pipeline_summary.json found in directory {path}")
+            add_sample_dirs(sample_dirs)
+        elif not path.exists():
+            logging.warning(f"Input path does not exist and will be skipped: {path}")
         elif zipfile.is_zipfile(path):
             logging.info(f"Extracting zip file: {path}")
             temp_dir = tempfile.mkdtemp(prefix="cohort_zip_")
             try:
                 with zipfile.ZipFile(path, "r") as zip_ref:
                     zip_ref.extractall(temp_dir)
-                temp_path = Path(temp_dir)
-                if (temp_path / "pipeline_summary.json").exists():
-                    logging.info(f"Found pipeline_summary.json in {temp_path}")
-                    processed_dirs.add(temp_path)
-                else:
-                    found = False
-                    for summary_file_path in temp_path.rglob("pipeline_summary.json"):
-                        sample_dir = summary_file_path.parent
-                        logging.info(f"Found pipeline_summary.json in {sample_dir}")
-                        processed_dirs.add(sample_dir)
-                        found = True
-                    if not found:
-                        logging.warning(
-                            f"No pipeline_summary.json found in extracted zip file: {path}"
-                        )
+                sample_dirs = collect_sample_dirs(Path(temp_dir))
+                if not sample_dirs:
+                    logging.warning(
+                        f"No pipeline_summary.json found in extracted zip file: {path}"
+                    )
+                add_sample_dirs(sample_dirs)
                 temp_dirs.append(temp_dir)
             except zipfile.BadZipFile as e:
                 logging.error(f"Bad zip file {path}: {e}")
@@ -641,39 +834,58 @@ def aggregate_cohort(input_paths, output_dir, summary_file, config):
         )
         return
 
-    kestrel_list = []
-    advntr_list = []
-    for sample_dir in processed_dirs:
+    # Summaries of plain directories are cached across cohort runs; samples
+    # extracted from zip files live in fresh temp dirs and are never cached.
+    cache_dir = Path(output_dir) / ".cohort_cache"
+    extracted_roots = [Path(os.path.abspath(temp_dir)) for temp_dir in temp_dirs]
+
+    def is_extracted(sample_dir):
+        return any(Path(sample_dir).is_relative_to(root) for root in extracted_roots)
+
+    def load_sample(sample_dir):
+        if is_extracted(sample_dir):
+            return load_pipeline_summary_for_sample(sample_dir)
+        return load_pipeline_summary_cached(sample_dir, cache_dir)
+
+    # Summaries are independent small JSON files, so read them concurrently;
+    # the per-sample bookkeeping below stays sequential and in sorted order.
+    sample_dirs = sorted(processed_dirs.values())
+    with ThreadPoolExecutor() as executor:
+        loaded_summaries = list(executor.map(load_sample, sample_dirs))
+
+    # Keep only the entries of this run's cached samples.
+    current_entries = {
+        cache_file.name
+        for sample_dir in sample_dirs
+        if not is_extracted(sample_dir)
+        and (cache_file := summary_cache_file(sample_dir, cache_dir)) is not None
+    }
+    prune_summary_cache(cache_dir, current_entries)
+
+    kestrel_records = []
+    advntr_records = []
+    for sample_dir, (k_data, a_data) in zip(sample_dirs, loaded_summaries):
         sample_id = Path(sample_dir).name
         logging.info(f"Processing sample directory: {sample_dir}")
-        k_data, a_data = load_pipeline_summary_for_sample(sample_dir)
         if k_data:
-            for entry in k_data:
-                entry["Sample"] = sample_id
-            kestrel_list.extend(k_data)
+            kestrel_records.append((sample_id, k_data))
         else:
             logging.warning(
                 f"No Kestrel data found in pipeline summary for sample {sample_id}."
             )
         if a_data:
-            for entry in a_data:
-                entry["Sample"] = sample_id
-            advntr_list.extend(a_data)
+            advntr_records.append((sample_id, a_data))
         else:
             logging.warning(
                 f"No adVNTR data found in pipeline summary for sample {sample_id}."
             )
 
-    if kestrel_list:
-        kestrel_df = pd.DataFrame(kestrel_list)
-    else:
+    if not kestrel_records:
         logging.warning("No Kestrel data found in any sample.")
-        kestrel_df = pd.DataFrame()
-    if advntr_list:
-        advntr_df = pd.DataFrame(advntr_list)
-    else:
+    if not advntr_records:
         logging.warning("No adVNTR data found in any sample.")
-        advntr_df = pd.DataFrame()
+    kestrel_df = build_cohort_frame(kestrel_records)
+    advntr_df = build_cohort_frame(advntr_records)
 
     generate_cohort_summary_report(
         output_dir=output_dir,
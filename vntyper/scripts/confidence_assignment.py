@@ -41,7 +41,7 @@ def calculate_depth_score_and_assign_confidence(
         final Confidence is not 'Negative'.
       - Depth_Score is computed as:
              Depth_Score = Estimated_Depth_AlternateVariant / Estimated_Depth_Variant_ActiveRegion
-        Any infinite values (resulting from division by zero) are replaced with NaN.
+        A zero active-region depth (division by zero) yields NaN.
 
     Args:
         df (pd.DataFrame):
@@ -60,7 +60,8 @@ def calculate_depth_score_and_assign_confidence(
         pd.DataFrame:
             Same shape as input, with:
               - 'Depth_Score' (float)
-              - 'Confidence' (str, e.g., 'Low_Precision', 'High_Precision', etc.)
+              - 'Confidence' (categorical of the configured labels and
+                'Negative', e.g., 'Low_Precision', 'High_Precision', etc.)
               - 'depth_confidence_pass' (bool; True if Confidence != 'Negative')
     """
     logging.debug("Entering calculate_depth_score_and_assign_confidence")
@@ -93,55 +94,64 @@ def calculate_depth_score_and_assign_confidence(
     alt_mid_low = alt_thresholds.get("mid_low", 10)
     alt_mid_high = alt_thresholds.get("mid_high", 20)
 
-    # Convert depth columns to numeric for arithmetic (using float)
+    # Convert depth columns to numeric for arithmetic (unparsable values are
+    # filled with 0). Read depths fit in int32, which halves the columns
+    # while keeping the same width for every sample.
     depth_cols = [
         "Estimated_Depth_AlternateVariant",
         "Estimated_Depth_Variant_ActiveRegion",
     ]
     for col in depth_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype("int32")
 
-    # Step 2: Calculate Depth_Score (avoid division by zero -> np.nan)
-    df["Depth_Score"] = (
-        df["Estimated_Depth_AlternateVariant"]
-        / df["Estimated_Depth_Variant_ActiveRegion"]
-    )
-    # Replace any infinite values (resulting from division by zero) with NaN
-    df["Depth_Score"] = df["Depth_Score"].replace([np.inf, -np.inf], np.nan)
+    alt = df["Estimated_Depth_AlternateVariant"].to_numpy()
+    region = df["Estimated_Depth_Variant_ActiveRegion"].to_numpy()
 
-    # Step 3: Assign Confidence
-    # Default all rows to 'Negative', then update based on conditions.
-    df["Confidence"] = "Negative"
+    # Step 2: Calculate Depth_Score on the NumPy arrays; a zero region depth
+    # gives NaN directly instead of an infinity that is replaced afterwards.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        score = np.where(region != 0, alt / region, np.nan)
+    df["Depth_Score"] = score
 
-    # Condition 1: Low Precision if Depth_Score <= low_threshold OR region depth <= var_region_threshold
-    cond1 = (df["Depth_Score"] <= low_threshold) | (
-        df["Estimated_Depth_Variant_ActiveRegion"] <= var_region_threshold
+    # Step 3: Assign Confidence
+    # The conditions are evaluated on the underlying NumPy arrays and resolved
+    # with a single np.select. They are listed from highest to lowest
+    # precedence (the first matching condition wins); rows matching none stay
+    # 'Negative'.
+
+    # High Precision if alt_depth is in [mid_low, mid_high) and Depth_Score >= high_threshold
+    high_prec = (alt >= alt_mid_low) & (alt < alt_mid_high) & (score >= high_threshold)
+    # Low Precision if alt depth <= alt_low
+    low_alt = alt <= alt_low
+    # Low Precision if alt_depth is between mid_low and mid_high, and
+    # Depth_Score between low_threshold and high_threshold
+    mid_range = (
+        (alt >= alt_mid_low)
+        & (alt <= alt_mid_high)
+        & (score >= low_threshold)
+        & (score <= high_threshold)
     )
-
-    # Condition 2: High Precision STAR if alt depth >= alt_mid_high AND Depth_Score >= high_threshold
-    cond2 = (df["Estimated_Depth_AlternateVariant"] >= alt_mid_high) & (
-        df["Depth_Score"] >= high_threshold
+    # High Precision STAR if alt depth >= alt_mid_high AND Depth_Score >= high_threshold
+    high_prec_star = (alt >= alt_mid_high) & (score >= high_threshold)
+    # Low Precision if Depth_Score <= low_threshold OR region depth <= var_region_threshold
+    low_score = (score <= low_threshold) | (region <= var_region_threshold)
+
+    # Labels from the config may coincide; categories must be unique.
+    labels = list(
+        dict.fromkeys(
+            [low_prec_label, high_prec_label, high_prec_star_label, "Negative"]
+        )
     )
-
-    # Condition 3: Low Precision if alt_depth is between mid_low and mid_high, and Depth_Score between low_threshold and high_threshold
-    cond3 = df["Estimated_Depth_AlternateVariant"].between(
-        alt_mid_low, alt_mid_high
-    ) & df["Depth_Score"].between(low_threshold, high_threshold)
-
-    # Condition 4: Low Precision if alt depth <= alt_low
-    cond4 = df["Estimated_Depth_AlternateVariant"] <= alt_low
-
-    # Condition 5: High Precision if alt_depth is between mid_low and mid_high and Depth_Score >= high_threshold
-    cond5 = df["Estimated_Depth_AlternateVariant"].between(
-        alt_mid_low, alt_mid_high, inclusive="left"
-    ) & (df["Depth_Score"] >= high_threshold)
-
-    # Apply conditions in order (later conditions can overwrite earlier ones)
-    df.loc[cond1, "Confidence"] = low_prec_label
-    df.loc[cond2, "Confidence"] = high_prec_star_label
-    df.loc[cond3, "Confidence"] = low_prec_label
-    df.loc[cond4, "Confidence"] = low_prec_label
-    df.loc[cond5, "Confidence"] = high_prec_label
+    low, high, high_star = (
+        labels.index(label)
+        for label in (low_prec_label, high_prec_label, high_prec_star_label)
+    )
+    codes = np.select(
+        [high_prec, low_alt, mid_range, high_prec_star, low_score],
+        [high, low, low, high_star, low],
+        default=labels.index("Negative"),
+    )
+    df["Confidence"] = pd.Categorical.from_codes(codes, categories=labels)
 
     # Step 4: Mark pass/fail: Passing means Confidence != 'Negative'
     df["depth_confidence_pass"] = df["Confidence"] != "Negative"
@@ -2,17 +2,42 @@
 # vntyper/scripts/generate_report.py
 
 import os
+import html
 import logging
+import mmap
 import subprocess
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-import re
 
+import numpy as np
 import pandas as pd
-from jinja2 import Environment, FileSystemLoader
 
-from vntyper.scripts.utils import load_config
+try:
+    # Optional: orjson parses bytes directly and is much faster on the large
+    # per-cycle histograms in fastp's JSON output.
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from vntyper.scripts.utils import get_jinja_env, load_config
+
+# Status icons shown next to quality metrics.
+_RED_ICON = '<span style="color:red;font-weight:bold;">&#9888;</span>'
+_GREEN_ICON = '<span style="color:green;font-weight:bold;">&#10004;</span>'
+
+# Text colour used to highlight Kestrel Confidence values in the report.
+_CONF_STYLE = {
+    "Low_Precision": "orange",
+    "High_Precision": "red",
+    "High_Precision*": "red",
+}
+
+# Characters DataFrame.to_html writes as escape sequences in cell text.
+_HTML_CELL_TRANSLATION = str.maketrans({"\t": "\\t", "\n": "\\n", "\r": "\\r"})
 
 
 def load_pipeline_summary(summary_file_path):
@@ -26,82 +51,124 @@ def load_pipeline_summary(summary_file_path):
         dict: The loaded summary dictionary or an empty dict if load fails.
     """
     logging.info("Loading pipeline summary from %s", summary_file_path)
-    if not os.path.exists(summary_file_path):
-        logging.error("Pipeline summary file not found: %s", summary_file_path)
-        return {}
     try:
         with open(summary_file_path, "r") as f:
             summary = json.load(f)
         logging.debug("Pipeline summary loaded successfully.")
         return summary
+    except FileNotFoundError:
+        logging.error("Pipeline summary file not found: %s", summary_file_path)
+        return {}
     except Exception as e:
         logging.error("Failed to load pipeline summary: %s", e)
         return {}
 
 
-def run_igv_report(
+def start_igv_report(
     bed_file, bam_file, fasta_file, output_html, flanking=50, vcf_file=None, config=None
 ):
     """
-    Wrapper around `create_report` IGV command. If config is provided and flanking
-    is not explicitly set, we fall back to config's default_values.flanking.
+    Launches the `create_report` IGV command in the background and returns its
+    process; use wait_igv_report() to wait for it. If config is provided and
+    flanking is not explicitly set, we fall back to config's default_values.flanking.
     Skips passing None for track arguments (vcf_file or bam_file).
     """
-    logging.debug("run_igv_report called with:")
-    logging.debug("  bed_file=%s", bed_file)
-    logging.debug("  bam_file=%s", bam_file)
-    logging.debug("  fasta_file=%s", fasta_file)
-    logging.debug("  output_html=%s", output_html)
-    logging.debug("  vcf_file=%s", vcf_file)
-    logging.debug("  flanking=%s", flanking)
+    debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+    if debug:
+        logging.debug("start_igv_report called with:")
+        logging.debug("  bed_file=%s", bed_file)
+        logging.debug("  bam_file=%s", bam_file)
+        logging.debug("  fasta_file=%s", fasta_file)
+        logging.debug("  output_html=%s", output_html)
+        logging.debug("  vcf_file=%s", vcf_file)
+        logging.debug("  flanking=%s", flanking)
 
     if config is not None and flanking == 50:
         flanking = config.get("default_values", {}).get("flanking", 50)
-        logging.debug("Flanking region set to %s based on config.", flanking)
-
-    bed_file = str(bed_file) if bed_file else None
-    bam_file = str(bam_file) if bam_file else None
-    fasta_file = str(fasta_file) if fasta_file else None
-    output_html = str(output_html) if output_html else None
+        if debug:
+            logging.debug("Flanking region set to %s based on config.", flanking)
 
+    tracks = [str(track) for track in (vcf_file, bam_file) if track]
+    if not tracks:
+        logging.warning(
+            "No valid tracks (VCF or BAM) provided to IGV. The IGV report may be empty."
+        )
     igv_report_cmd = [
         "create_report",
-        bed_file,
+        str(bed_file) if bed_file else None,
         "--flanking",
         str(flanking),
         "--fasta",
-        fasta_file,
+        str(fasta_file) if fasta_file else None,
         "--tracks",
+        *tracks,
+        "--output",
+        str(output_html) if output_html else None,
     ]
-    tracks = []
-    if vcf_file:
-        tracks.append(str(vcf_file))
-    if bam_file:
-        tracks.append(str(bam_file))
-    if not tracks:
-        logging.warning(
-            "No valid tracks (VCF or BAM) provided to IGV. The IGV report may be empty."
-        )
-    igv_report_cmd.extend(tracks)
-    igv_report_cmd.extend(["--output", output_html])
 
-    logging.debug(
-        "IGV report command: %s", " ".join([str(x) for x in igv_report_cmd if x])
-    )
+    # Format the command line once for both log records.
+    cmd_line = " ".join(arg for arg in igv_report_cmd if arg)
+    if debug:
+        logging.debug("IGV report command: %s", cmd_line)
     try:
-        logging.info(
-            "Running IGV report: %s", " ".join([str(x) for x in igv_report_cmd if x])
-        )
-        subprocess.run(igv_report_cmd, check=True)
-        logging.info("IGV report successfully generated at %s", output_html)
-    except subprocess.CalledProcessError as e:
-        logging.error("Error generating IGV report: %s", e)
-        raise
+        logging.info("Running IGV report: %s", cmd_line)
+        return subprocess.Popen(igv_report_cmd)
     except Exception as e:
         logging.error("Unexpected error generating IGV report: %s", e)
         raise
 
 
+def wait_igv_report(igv_process, output_html):
+    """
+    Waits for an IGV report process started by start_igv_report().
+
+    Raises:
+        subprocess.CalledProcessError: If `create_report` failed.
+    """
+    returncode = igv_process.wait()
+    if returncode != 0:
+        error = subprocess.CalledProcessError(returncode, igv_process.args)
+        logging.error("Error generating IGV report: %s", error)
+        raise error
+    logging.info("IGV report successfully generated at %s", output_html)
+
+
+def stop_igv_report(igv_process):
+    """
+    Terminates an IGV report process started by start_igv_report() if it is
+    still running (killing it if it does not exit in time) and reaps it.
+    """
+    if igv_process.poll() is None:
+        igv_process.terminate()
+    try:
+        igv_process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        igv_process.kill()
+        igv_process.wait()
+
+
+def run_igv_report(
+    bed_file, bam_file, fasta_file, output_html, flanking=50, vcf_file=None, config=None
+):
+    """
+    Wrapper around `create_report` IGV command that blocks until the report is
+    written. See start_igv_report() for the arguments.
+    """
+    igv_process = start_igv_report(
+        bed_file,
+        bam_file,
+        fasta_file,
+        output_html,
+        flanking=flanking,
+        vcf_file=vcf_file,
+        config=config,
+    )
+    try:
+        wait_igv_report(igv_process, output_html)
+    finally:
+        stop_igv_report(igv_process)
+
+
 def extract_igv_content(igv_report_html):
     """
     Reads the generated IGV HTML report and extracts the IGV content,
@@ -110,29 +177,31 @@ def extract_igv_content(igv_report_html):
     """
     logging.debug("extract_igv_content called with igv_report_html=%s", igv_report_html)
     try:
-        with open(igv_report_html, "r") as f:
-            content = f.read()
-
-        igv_start = content.find('<div id="container"')
-        igv_end = content.find("</body>")
-
-        if igv_start == -1 or igv_end == -1:
-            logging.error("Failed to extract IGV content from report.")
-            return "", "", ""
-
-        igv_content = content[igv_start:igv_end].strip()
-
-        table_json_start = content.find("const tableJson = ") + len(
-            "const tableJson = "
-        )
-        table_json_end = content.find("\n", table_json_start)
-        table_json = content[table_json_start:table_json_end].strip()
-
-        session_dict_start = content.find("const sessionDictionary = ") + len(
-            "const sessionDictionary = "
-        )
-        session_dict_end = content.find("\n", session_dict_start)
-        session_dictionary = content[session_dict_start:session_dict_end].strip()
+        # Search the memory-mapped file directly and decode only the extracted
+        # slices, instead of reading the whole (potentially very large) report
+        # into a string.
+        with open(igv_report_html, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            igv_start = mm.find(b'<div id="container"')
+            igv_end = mm.find(b"</body>")
+
+            if igv_start == -1 or igv_end == -1:
+                logging.error("Failed to extract IGV content from report.")
+                return "", "", ""
+
+            igv_content = mm[igv_start:igv_end].decode("utf-8").strip()
+
+            def script_value(marker):
+                start = mm.find(marker)
+                if start == -1:
+                    return ""
+                start += len(marker)
+                end = mm.find(b"\n", start)
+                return mm[start:end if end != -1 else len(mm)].decode("utf-8").strip()
+
+            table_json = script_value(b"const tableJson = ")
+            session_dictionary = script_value(b"const sessionDictionary = ")
 
         logging.info(
             "Successfully extracted IGV content, tableJson, and sessionDictionary."
@@ -152,36 +221,64 @@ def load_fastp_output(fastp_file):
     Returns an empty dict if file not found or if parsing fails.
     """
     logging.debug("load_fastp_output called with fastp_file=%s", fastp_file)
-    if not os.path.exists(fastp_file):
-        logging.warning("fastp output file not found: %s", fastp_file)
-        return {}
     try:
-        with open(fastp_file, "r") as f:
-            data = json.load(f)
+        with open(fastp_file, "rb") as f:
+            data = _json_loads(f.read())
         logging.debug("fastp output successfully loaded.")
         return data
+    except FileNotFoundError:
+        logging.warning("fastp output file not found: %s", fastp_file)
+        return {}
     except Exception as e:
         logging.error("Failed to load or parse fastp output: %s", e)
         return {}
 
 
-def load_pipeline_log(log_file):
+def _dig(data, *keys, default=None):
+    """
+    Follows `keys` through nested dicts, e.g. _dig(d, "summary", "q20_rate").
+    Returns `default` as soon as a level is missing, None or not a dict.
+    """
+    for key in keys:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
+def load_pipeline_log(log_file, tail_bytes=1_048_576):
     """
     Loads the pipeline log content from the specified log_file.
+    Only the last `tail_bytes` bytes are read (starting at the first full line),
+    so very long logs do not bloat the report; a note marks the truncation.
     Returns a placeholder string if not found or on error.
     """
     logging.info("Loading pipeline log from %s", log_file)
     if not log_file:
         logging.warning("No pipeline log file provided; skipping log loading.")
         return "No pipeline log file was provided."
-    if not os.path.exists(log_file):
-        logging.warning("Pipeline log file not found: %s", log_file)
-        return "Pipeline log file not found."
     try:
-        with open(log_file, "r") as f:
-            content = f.read()
+        with open(log_file, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            truncated = size > tail_bytes
+            f.seek(size - tail_bytes if truncated else 0)
+            data = f.read()
+        if truncated:
+            # Drop the partial first line
+            data = data[data.find(b"\n") + 1:]
+        content = data.decode("utf-8", errors="replace")
+        if truncated:
+            content = (
+                f"[... log truncated; showing the last {len(data)} of {size} bytes ...]\n"
+                + content
+            )
         logging.debug("Pipeline log successfully loaded.")
         return content
+    except FileNotFoundError:
+        logging.warning("Pipeline log file not found: %s", log_file)
+        return "Pipeline log file not found."
     except Exception as e:
         logging.error("Failed to read pipeline log file: %s", e)
         return "Failed to load pipeline log."
@@ -424,6 +521,77 @@ def build_screening_summary(
     return summary_text
 
 
+def _is_plain_column(column):
+    """
+    True if every value of `column` is rendered by to_html as str(value):
+    integer and boolean columns, and text columns (object, string or
+    categorical) holding only strings and missing values.
+    """
+    dtype = column.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return _is_plain_column(column.cat.categories.to_series())
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return not isinstance(dtype, pd.api.extensions.ExtensionDtype)
+    if dtype == object or pd.api.types.is_string_dtype(dtype):
+        return all(
+            isinstance(value, str) or value is None or value != value
+            for value in column
+        )
+    return False
+
+
+def _fast_to_html(df, classes, escape=True):
+    """
+    Render a DataFrame as an HTML table, like DataFrame.to_html(index=False).
+
+    The report tables are small and hold plain strings (the pipeline summary
+    stores every cell as text), so building the rows with str.join is much
+    cheaper than pandas' per-cell HTML formatter. The markup matches
+    pandas' output. Tables with other values (e.g. floats, which pandas
+    formats per column) are rendered by to_html itself.
+
+    Args:
+        df (pd.DataFrame): Table to render.
+        classes (str): CSS classes added after "dataframe".
+        escape (bool): Whether to HTML-escape cell values.
+
+    Returns:
+        str: The HTML table.
+    """
+    if not all(_is_plain_column(df[column]) for column in df.columns) or not all(
+        isinstance(column, str) for column in df.columns
+    ):
+        return df.to_html(index=False, classes=classes, escape=escape)
+
+    def cell(value):
+        if value is None:
+            return "None"
+        if isinstance(value, float) and value != value:
+            return "NaN"
+        text = str(value).translate(_HTML_CELL_TRANSLATION)
+        return (html.escape(text, quote=False) if escape else text).strip()
+
+    header = "".join(f"      <th>{cell(column)}</th>\n" for column in df.columns)
+    body = "".join(
+        "    <tr>\n"
+        + "".join(f"      <td>{cell(value)}</td>\n" for value in row)
+        + "    </tr>\n"
+        for row in df.itertuples(index=False, name=None)
+    )
+    return (
+        f'<table border="1" class="dataframe {classes}">\n'
+        "  <thead>\n"
+        '    <tr style="text-align: right;">\n'
+        f"{header}"
+        "    </tr>\n"
+        "  </thead>\n"
+        "  <tbody>\n"
+        f"{body}"
+        "  </tbody>\n"
+        "</table>"
+    )
+
+
 def generate_summary_report(
     output_dir,
     template_dir,
@@ -494,114 +662,14 @@ def generate_summary_report(
     q30_rate_cutoff = thresholds.get("q30_rate", 0.7)
     passed_filter_rate_cutoff = thresholds.get("passed_filter_reads_rate", 0.8)
 
-    # Load the pipeline summary JSON.
-    summary_file_path = Path(output_dir) / "pipeline_summary.json"
-    pipeline_summary = load_pipeline_summary(summary_file_path)
-
-    # Extract input_files and pipeline_version from the summary.
-    input_files = pipeline_summary.get("input_files", {})
-    pipeline_version = pipeline_summary.get("version", "unknown")
-
-    # Extract mean VNTR coverage from the "Coverage Calculation" step.
-    mean_vntr_coverage = None
-    for step in pipeline_summary.get("steps", []):
-        if step.get("step") == "Coverage Calculation":
-            coverage_info = step.get("parsed_result", {}).get("data", [])
-            if (
-                coverage_info
-                and isinstance(coverage_info, list)
-                and len(coverage_info) > 0
-            ):
-                try:
-                    mean_vntr_coverage = float(coverage_info[0].get("mean", 0))
-                    logging.debug(
-                        "Mean VNTR coverage extracted: %s", mean_vntr_coverage
-                    )
-                except Exception as e:
-                    logging.error("Error parsing mean VNTR coverage: %s", e)
-                    mean_vntr_coverage = None
-            break
-
-    # Extract Kestrel and adVNTR data from the summary.
-    kestrel_data = []
-    advntr_data = []
-    advntr_available = False
-    for step in pipeline_summary.get("steps", []):
-        if step.get("step") == "Kestrel Genotyping":
-            kestrel_data = step.get("parsed_result", {}).get("data", [])
-        elif step.get("step") == "adVNTR Genotyping":
-            advntr_data = step.get("parsed_result", {}).get("data", [])
-            advntr_available = True
-
-    if kestrel_data:
-        kestrel_df = pd.DataFrame(kestrel_data)
-        columns_to_display = {
-            "Motifs": "Motif",
-            "Variant": "Variant",
-            "POS": "Position",
-            "REF": "REF",
-            "ALT": "ALT",
-            "Motif_sequence": "Motif Sequence",
-            "Estimated_Depth_AlternateVariant": "Depth (Variant)",
-            "Estimated_Depth_Variant_ActiveRegion": "Depth (Region)",
-            "Depth_Score": "Depth Score",
-            "Confidence": "Confidence",
-            "Flag": "Flag",
-        }
-        existing_cols = [col for col in columns_to_display if col in kestrel_df.columns]
-        kestrel_df = kestrel_df[existing_cols]
-        kestrel_df = kestrel_df.rename(
-            columns={col: columns_to_display[col] for col in existing_cols}
-        )
-        # Create a copy of the original dataframe (without HTML formatting) for matching.
-        kestrel_df_raw = kestrel_df.copy()
-        # Now apply color-coding to the Confidence column for display.
-        if "Confidence" in kestrel_df.columns:
-            kestrel_df["Confidence"] = kestrel_df["Confidence"].apply(
-                lambda x: (
-                    f'<span style="color:orange;font-weight:bold;">{x}</span>'
-                    if x == "Low_Precision"
-                    else (
-                        f'<span style="color:red;font-weight:bold;">{x}</span>'
-                        if x in ["High_Precision", "High_Precision*"]
-                        else x
-                    )
-                )
-            )
-        logging.debug("Kestrel data extracted from summary and formatted.")
-    else:
-        kestrel_df = pd.DataFrame()
-        kestrel_df_raw = pd.DataFrame()
-        logging.warning("No Kestrel data found in pipeline summary.")
-
-    if advntr_data:
-        advntr_df = pd.DataFrame(advntr_data)
-        advntr_columns = [
-            "VID",
-            "Variant",
-            "NumberOfSupportingReads",
-            "MeanCoverage",
-            "Pvalue",
-            "RU",
-            "POS",
-            "REF",
-            "ALT",
-            "Flag",
-        ]
-        advntr_df = advntr_df[
-            [col for col in advntr_columns if col in advntr_df.columns]
-        ]
-        logging.debug("adVNTR data extracted from summary and formatted.")
-    else:
-        advntr_df = pd.DataFrame()
-
-    log_content = load_pipeline_log(log_file)
-
-    # IGV report generation (if applicable)
-    if bed_file and os.path.exists(bed_file):
+    # Start the IGV report (if applicable) first: it runs as a separate process
+    # while the summary, log and fastp output are loaded and processed below.
+    # Each input is stat'ed once; the loaders below open their files directly
+    # and handle FileNotFoundError instead of checking beforehand.
+    if bed_file and os.path.isfile(bed_file):
         logging.info("Running IGV report for BED file: %s", bed_file)
         igv_report_file = Path(output_dir) / "igv_report.html"
-        run_igv_report(
+        igv_process = start_igv_report(
             bed_file,
             bam_file,
             fasta_file,
@@ -615,6 +683,132 @@ def generate_summary_report(
             "BED file does not exist or not provided. Skipping IGV report generation."
         )
         igv_report_file = None
+        igv_process = None
+
+    # Make sure the IGV process does not outlive this call if anything
+    # below fails before it has been waited on.
+    try:
+        # The log and fastp files are independent of the summary; read them on
+        # worker threads meanwhile.
+        fastp_file = Path(output_dir) / "fastq_bam_processing/output.json"
+        executor = ThreadPoolExecutor(max_workers=2)
+        log_future = executor.submit(
+            load_pipeline_log,
+            log_file,
+            tail_bytes=thresholds.get("log_tail_bytes", 1_048_576),
+        )
+        fastp_future = executor.submit(load_fastp_output, fastp_file)
+        executor.shutdown(wait=False)
+
+        # Load the pipeline summary JSON.
+        summary_file_path = Path(output_dir) / "pipeline_summary.json"
+        pipeline_summary = load_pipeline_summary(summary_file_path)
+
+        # Extract input_files and pipeline_version from the summary.
+        input_files = pipeline_summary.get("input_files", {})
+        pipeline_version = pipeline_summary.get("version", "unknown")
+
+        # Extract mean VNTR coverage from the "Coverage Calculation" step.
+        mean_vntr_coverage = None
+        for step in pipeline_summary.get("steps", []):
+            if step.get("step") == "Coverage Calculation":
+                coverage_info = step.get("parsed_result", {}).get("data", [])
+                if (
+                    coverage_info
+                    and isinstance(coverage_info, list)
+                    and len(coverage_info) > 0
+                ):
+                    try:
+                        mean_vntr_coverage = float(coverage_info[0].get("mean", 0))
+                        logging.debug(
+                            "Mean VNTR coverage extracted: %s", mean_vntr_coverage
+                        )
+                    except Exception as e:
+                        logging.error("Error parsing mean VNTR coverage: %s", e)
+                        mean_vntr_coverage = None
+                break
+
+        # Extract Kestrel and adVNTR data from the summary.
+        kestrel_data = []
+        advntr_data = []
+        advntr_available = False
+        for step in pipeline_summary.get("steps", []):
+            if step.get("step") == "Kestrel Genotyping":
+                kestrel_data = step.get("parsed_result", {}).get("data", [])
+            elif step.get("step") == "adVNTR Genotyping":
+                advntr_data = step.get("parsed_result", {}).get("data", [])
+                advntr_available = True
+
+        if kestrel_data:
+            columns_to_display = {
+                "Motifs": "Motif",
+                "Variant": "Variant",
+                "POS": "Position",
+                "REF": "REF",
+                "ALT": "ALT",
+                "Motif_sequence": "Motif Sequence",
+                "Estimated_Depth_AlternateVariant": "Depth (Variant)",
+                "Estimated_Depth_Variant_ActiveRegion": "Depth (Region)",
+                "Depth_Score": "Depth Score",
+                "Confidence": "Confidence",
+                "Flag": "Flag",
+            }
+            # Build the frame with only the displayed columns, then rename once.
+            present_cols = {key for record in kestrel_data for key in record}
+            existing_cols = [col for col in columns_to_display if col in present_cols]
+            kestrel_df_raw = pd.DataFrame.from_records(
+                kestrel_data, columns=existing_cols
+            ).rename(columns=columns_to_display)
+            # The raw frame (without HTML formatting) is kept for matching; the
+            # display frame only replaces its Confidence column, so no full copy
+            # of the table is needed.
+            kestrel_df = kestrel_df_raw
+            if "Confidence" in kestrel_df_raw.columns:
+                # Confidence takes only a handful of distinct values, so style the
+                # categories rather than concatenating HTML for every row.
+                conf = kestrel_df_raw["Confidence"].astype("category")
+                styled_confidence = conf.cat.rename_categories(
+                    lambda value: (
+                        f'<span style="color:{_CONF_STYLE[value]};font-weight:bold;">{value}</span>'
+                        if value in _CONF_STYLE
+                        else value
+                    )
+                )
+                kestrel_df = kestrel_df_raw.assign(Confidence=styled_confidence)
+            logging.debug("Kestrel data extracted from summary and formatted.")
+        else:
+            kestrel_df = pd.DataFrame()
+            kestrel_df_raw = pd.DataFrame()
+            logging.warning("No Kestrel data found in pipeline summary.")
+
+        if advntr_data:
+            advntr_df = pd.DataFrame(advntr_data)
+            advntr_columns = [
+                "VID",
+                "Variant",
+                "NumberOfSupportingReads",
+                "MeanCoverage",
+                "Pvalue",
+                "RU",
+                "POS",
+                "REF",
+                "ALT",
+                "Flag",
+            ]
+            advntr_df = advntr_df[
+                [col for col in advntr_columns if col in advntr_df.columns]
+            ]
+            logging.debug("adVNTR data extracted from summary and formatted.")
+        else:
+            advntr_df = pd.DataFrame()
+
+        log_content = log_future.result()
+
+        if igv_process is not None:
+            wait_igv_report(igv_process, igv_report_file)
+    finally:
+        if igv_process is not None:
+            stop_igv_report(igv_process)
 
     if igv_report_file and igv_report_file.exists():
         igv_content, table_json, session_dictionary = extract_igv_content(
@@ -624,17 +818,16 @@ def generate_summary_report(
         logging.warning("IGV report file not found. Skipping IGV content.")
         igv_content, table_json, session_dictionary = "", "", ""
 
-    fastp_file = Path(output_dir) / "fastq_bam_processing/output.json"
-    fastp_data = load_fastp_output(fastp_file)
+    fastp_data = fastp_future.result()
 
-    if mean_vntr_coverage is not None and mean_vntr_coverage < mean_vntr_cov_threshold:
-        coverage_icon = '<span style="color:red;font-weight:bold;">&#9888;</span>'
-        coverage_color = "red"
-        logging.debug("Mean VNTR coverage is below the threshold.")
-    else:
-        coverage_icon = '<span style="color:green;font-weight:bold;">&#10004;</span>'
-        coverage_color = "green"
-        logging.debug("Mean VNTR coverage is above the threshold.")
+    coverage_low = (
+        mean_vntr_coverage is not None and mean_vntr_coverage < mean_vntr_cov_threshold
+    )
+    coverage_icon = _RED_ICON if coverage_low else _GREEN_ICON
+    coverage_color = "red" if coverage_low else "green"
+    logging.debug(
+        "Mean VNTR coverage is %s the threshold.", "below" if coverage_low else "above"
+    )
 
     duplication_rate = None
     q20_rate = None
@@ -644,19 +837,16 @@ def generate_summary_report(
     fastp_available = False
     if fastp_data:
         fastp_available = True
-        summary_fastp = fastp_data.get("summary", {})
-        duplication = fastp_data.get("duplication", {})
-        filtering_result = fastp_data.get("filtering_result", {})
-
-        duplication_rate = duplication.get("rate", None)
-        after_filtering = summary_fastp.get("after_filtering", {})
-        before_filtering = summary_fastp.get("before_filtering", {})
+        duplication_rate = _dig(fastp_data, "duplication", "rate")
+        q20_rate = _dig(fastp_data, "summary", "after_filtering", "q20_rate")
+        q30_rate = _dig(fastp_data, "summary", "after_filtering", "q30_rate")
 
-        q20_rate = after_filtering.get("q20_rate", None)
-        q30_rate = after_filtering.get("q30_rate", None)
-
-        total_reads_before = before_filtering.get("total_reads", 1)
-        passed_filter_reads = filtering_result.get("passed_filter_reads", 0)
+        total_reads_before = _dig(
+            fastp_data, "summary", "before_filtering", "total_reads", default=1
+        )
+        passed_filter_reads = _dig(
+            fastp_data, "filtering_result", "passed_filter_reads", default=0
+        )
         if total_reads_before > 0:
             passed_filter_rate = passed_filter_reads / total_reads_before
             logging.debug("Passed filter rate calculated: %.2f", passed_filter_rate)
@@ -665,71 +855,57 @@ def generate_summary_report(
             logging.debug(
                 "Total reads before filtering is zero; passed filter rate set to None."
             )
-        sequencing_str = summary_fastp.get("sequencing", "")
+        sequencing_str = _dig(fastp_data, "summary", "sequencing", default="")
         logging.debug("Sequencing setup: %s", sequencing_str)
 
-    def warn_icon(value, cutoff, higher_better=True):
-        if value is None:
-            logging.debug("warn_icon called with value=None; returning empty strings.")
-            return "", ""
-        if higher_better:
-            if value < cutoff:
-                logging.debug(
-                    "Value %s is below the cutoff %s (higher_better=True).",
-                    value,
-                    cutoff,
-                )
-                return '<span style="color:red;font-weight:bold;">&#9888;</span>', "red"
-            else:
-                logging.debug(
-                    "Value %s is above or equal to the cutoff %s (higher_better=True).",
-                    value,
-                    cutoff,
-                )
-                return (
-                    '<span style="color:green;font-weight:bold;">&#10004;</span>',
-                    "green",
-                )
-        else:
-            if value > cutoff:
-                logging.debug(
-                    "Value %s is above the cutoff %s (higher_better=False).",
-                    value,
-                    cutoff,
-                )
-                return '<span style="color:red;font-weight:bold;">&#9888;</span>', "red"
-            else:
-                logging.debug(
-                    "Value %s is below or equal to the cutoff %s (higher_better=False).",
-                    value,
-                    cutoff,
-                )
-                return (
-                    '<span style="color:green;font-weight:bold;">&#10004;</span>',
-                    "green",
-                )
-
-    dup_icon, dup_color = warn_icon(
-        duplication_rate, dup_rate_cutoff, higher_better=False
+    # Status icons for the fastp metrics, evaluated together: a metric is
+    # flagged red when it falls on the wrong side of its cutoff, and gets no
+    # icon when the value is unavailable.
+    metric_values = np.array(
+        [
+            np.nan if value is None else value
+            for value in (duplication_rate, q20_rate, q30_rate, passed_filter_rate)
+        ],
+        dtype=float,
+    )
+    metric_cutoffs = np.array(
+        [dup_rate_cutoff, q20_rate_cutoff, q30_rate_cutoff, passed_filter_rate_cutoff],
+        dtype=float,
     )
-    q20_icon, q20_color = warn_icon(q20_rate, q20_rate_cutoff, higher_better=True)
-    q30_icon, q30_color = warn_icon(q30_rate, q30_rate_cutoff, higher_better=True)
-    pf_icon, pf_color = warn_icon(
-        passed_filter_rate, passed_filter_rate_cutoff, higher_better=True
+    higher_better = np.array([False, True, True, True])
+    below_par = np.where(
+        higher_better, metric_values < metric_cutoffs, metric_values > metric_cutoffs
+    )
+    missing = np.isnan(metric_values)
+    metric_icons = np.where(
+        missing,
+        "",
+        np.where(below_par, _RED_ICON, _GREEN_ICON),
+    ).tolist()
+    metric_colors = np.where(
+        missing, "", np.where(below_par, "red", "green")
+    ).tolist()
+    logging.debug(
+        "fastp metric values %s vs cutoffs %s -> %s",
+        metric_values,
+        metric_cutoffs,
+        metric_colors,
     )
+    dup_icon, q20_icon, q30_icon, pf_icon = metric_icons
+    dup_color, q20_color, q30_color, pf_color = metric_colors
 
-    kestrel_html = kestrel_df.to_html(
+    kestrel_html = _fast_to_html(
+        kestrel_df,
         classes="table table-bordered table-striped hover compact order-column table-sm",
-        index=False,
         escape=False,
     )
     logging.debug("Kestrel results converted to HTML.")
 
     if advntr_available:
         if not advntr_df.empty:
-            advntr_html = advntr_df.to_html(
+            advntr_html = _fast_to_html(
+                advntr_df,
                 classes="table table-bordered table-striped hover compact order-column table-sm",
-                index=False,
             )
             logging.debug("adVNTR results converted to HTML.")
         else:
@@ -741,9 +917,8 @@ def generate_summary_report(
         advntr_html = "<p>adVNTR genotyping was not performed.</p>"
         logging.debug("adVNTR was not performed; adding message to report.")
 
-    env = Environment(loader=FileSystemLoader(template_dir))
     try:
-        template = env.get_template("report_template.html")
+        template = get_jinja_env(template_dir).get_template("report_template.html")
         logging.debug("Jinja2 template 'report_template.html' loaded successfully.")
     except Exception as e:
         logging.error("Failed to load Jinja2 template: %s", e)
@@ -793,18 +968,13 @@ def generate_summary_report(
         "summary_text": summary_text,
     }
 
-    try:
-        rendered_html = template.render(context)
-        logging.debug("Report template rendered successfully.")
-    except Exception as e:
-        logging.error("Failed to render the report template: %s", e)
-        raise
-
+    # Stream the rendered template straight into the file instead of holding
+    # the whole report (log tail, IGV content) in memory as one string first.
     report_file_path = Path(output_dir) / report_file
     try:
         with open(report_file_path, "w") as f:
-            f.write(rendered_html)
+            template.stream(context).dump(f)
         logging.info("Summary report generated and saved to %s", report_file_path)
     except Exception as e:
-        logging.error("Failed to write the summary report: %s", e)
+        logging.error("Failed to render or write the summary report: %s", e)
         raise
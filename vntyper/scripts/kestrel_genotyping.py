@@ -24,19 +24,34 @@ High-Level Flow:
 from Saei et al., iScience 26, 107171 (2023).
 """
 
+import atexit
+import io
 import logging
 import os
+import shlex
+import shutil
+import signal
+import socket
+import subprocess as sp
+import time
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
 from vntyper.scripts.file_processing import filter_indel_vcf, filter_vcf
 from vntyper.scripts.motif_processing import (
+    VCF_UNUSED_COLUMNS,
     load_additional_motifs,
     load_muc1_reference,
-    preprocessing_deletion,
-    preprocessing_insertion,
+    preprocessing_variants,
     motif_correction_and_annotation,  # Moved from the main script
 )
 from vntyper.scripts.utils import load_config, run_command
@@ -83,6 +98,11 @@ def load_kestrel_config(config_path=None):
 # by run_kestrel() and subsequent steps
 kestrel_config = load_kestrel_config()
 
+# Nailgun server process shared by all Kestrel runs of this process
+# (kestrel_settings.persistent_jvm), and its connection settings
+_nailgun_server = None
+_nailgun_settings = None
+
 
 def construct_kestrel_command(
     kmer_size,
@@ -99,6 +119,7 @@ def construct_kestrel_command(
     log_level,
     sample_name,
     additional_settings="",
+    nailgun=None,
 ):
     """
     Constructs the command for running Kestrel's mapping-free genotyping.
@@ -126,27 +147,262 @@ def construct_kestrel_command(
         sample_name (str): Sample name for labeling in the VCF.
         additional_settings (str, optional): Extra command-line options to append.
             Defaults to an empty string.
+        nailgun (dict, optional): Settings of a running Nailgun server (see
+            start_kestrel_nailgun_server()). When given, Kestrel is run through
+            the Nailgun client in that persistent JVM instead of a new one.
 
     Raises:
         ValueError: If either fastq_1 or fastq_2 is missing.
 
     Returns:
-        str: The constructed command line string to run Kestrel.
+        list of str: The argument list to run Kestrel with (no shell involved,
+            so paths containing spaces are passed through intact).
     """
     if not fastq_1 or not fastq_2:
         raise ValueError("FASTQ input files are missing or invalid.")
 
-    base_command = (
-        f"{java_path} -Xmx{java_memory} -jar {kestrel_path} -k {kmer_size} "
-        f"--maxalignstates {max_align_states} --maxhapstates {max_hap_states} "
-        f"-r {reference_vntr} -o {vcf_out} "
-        f"-s{sample_name} {fastq_1} {fastq_2} "
-        f"--hapfmt sam -p {output_dir}/output.sam --logstderr --logstdout "
-        f"--loglevel {log_level.upper()} --temploc {output_dir}"
-    )
+    if nailgun:
+        # The Nailgun server resolves relative paths against its own working
+        # directory, not the client's, so every file argument is absolute.
+        reference_vntr, output_dir, fastq_1, fastq_2, vcf_out = (
+            os.path.abspath(path)
+            for path in (reference_vntr, output_dir, fastq_1, fastq_2, vcf_out)
+        )
+        launcher = [
+            nailgun["client"],
+            "--nailgun-server",
+            nailgun["host"],
+            "--nailgun-port",
+            str(nailgun["port"]),
+            nailgun["main_class"],
+        ]
+    else:
+        launcher = [str(java_path), f"-Xmx{java_memory}", "-jar", str(kestrel_path)]
+
+    command = launcher + [
+        "-k",
+        str(kmer_size),
+        "--maxalignstates",
+        str(max_align_states),
+        "--maxhapstates",
+        str(max_hap_states),
+        "-r",
+        str(reference_vntr),
+        "-o",
+        str(vcf_out),
+        f"-s{sample_name}",
+        str(fastq_1),
+        str(fastq_2),
+        "--hapfmt",
+        "sam",
+        "-p",
+        f"{output_dir}/output.sam",
+        "--logstderr",
+        "--logstdout",
+        "--loglevel",
+        log_level.upper(),
+        "--temploc",
+        str(output_dir),
+    ]
     if additional_settings:
-        base_command += " " + additional_settings
-    return base_command
+        command += shlex.split(additional_settings)
+    return command
+
+
+def start_kestrel_nailgun_server(java_path, java_memory, kestrel_path, settings):
+    """
+    Starts (once per process) a Nailgun server JVM with Kestrel on its
+    classpath, so repeated Kestrel runs (several k-mer sizes, or many samples
+    in one batch) skip the JVM start-up and JIT warm-up. The server is stopped
+    when the interpreter exits.
+
+    Args:
+        java_path (str): Path to the Java executable.
+        java_memory (str): Memory allocated to the server JVM (e.g., "12g").
+        kestrel_path (str): Path to the Kestrel jar file.
+        settings (dict): kestrel_settings['nailgun'] with 'server_jar' and
+            optionally 'server_class', 'client', 'host', 'port' (0 or unset
+            picks a free port), 'main_class', 'startup_timeout'.
+
+    Returns:
+        dict or None: Connection settings for construct_kestrel_command(), or
+            None if the server could not be started (Kestrel then runs in a
+            fresh JVM as usual).
+    """
+    global _nailgun_server, _nailgun_settings
+
+    if _nailgun_server is not None and _nailgun_server.poll() is None:
+        return _nailgun_settings
+
+    nailgun = {
+        "client": settings.get("client", "ng"),
+        "host": settings.get("host", "127.0.0.1"),
+        "port": int(settings.get("port") or 0),
+        "main_class": settings.get(
+            "main_class", "edu.gatech.kestrel.runner.KestrelRunner"
+        ),
+    }
+    if not nailgun["port"]:
+        # No fixed port configured: use a free one, so pipelines running on
+        # the same host each talk to their own server.
+        with socket.socket() as probe:
+            probe.bind((nailgun["host"], 0))
+            nailgun["port"] = probe.getsockname()[1]
+
+    server_jar = settings.get("server_jar")
+    if not server_jar or not os.path.isfile(server_jar):
+        logging.warning(
+            f"Nailgun server jar not found ({server_jar!r}); "
+            "running Kestrel without a persistent JVM."
+        )
+        return None
+    if shutil.which(nailgun["client"]) is None:
+        logging.warning(
+            f"Nailgun client '{nailgun['client']}' not found; "
+            "running Kestrel without a persistent JVM."
+        )
+        return None
+
+    server_command = [
+        str(java_path),
+        f"-Xmx{java_memory}",
+        "-cp",
+        os.pathsep.join([server_jar, str(kestrel_path)]),
+        settings.get("server_class", "com.facebook.nailgun.NGServer"),
+        f"{nailgun['host']}:{nailgun['port']}",
+    ]
+    logging.info(f"Starting Nailgun server for Kestrel: {' '.join(server_command)}")
+    _nailgun_server = sp.Popen(
+        server_command,
+        stdout=sp.DEVNULL,
+        stderr=sp.DEVNULL,
+        start_new_session=True,
+    )
+
+    # Wait until the server accepts connections
+    deadline = time.monotonic() + settings.get("startup_timeout", 30)
+    while time.monotonic() < deadline and _nailgun_server.poll() is None:
+        try:
+            socket.create_connection((nailgun["host"], nailgun["port"]), 1).close()
+        except OSError:
+            time.sleep(0.1)
+            continue
+        atexit.register(stop_kestrel_nailgun_server, nailgun)
+        _nailgun_settings = nailgun
+        return nailgun
+
+    logging.warning(
+        "Nailgun server did not start; running Kestrel without a persistent JVM."
+    )
+    stop_kestrel_nailgun_server()
+    return None
+
+
+def stop_kestrel_nailgun_server(nailgun=None):
+    """
+    Stops the Nailgun server started by start_kestrel_nailgun_server(), asking
+    it to shut down through the client first if connection settings are given.
+    """
+    global _nailgun_server, _nailgun_settings
+
+    if _nailgun_server is None:
+        return
+    if nailgun and _nailgun_server.poll() is None:
+        sp.run(
+            [
+                nailgun["client"],
+                "--nailgun-server",
+                nailgun["host"],
+                "--nailgun-port",
+                str(nailgun["port"]),
+                "ng-stop",
+            ],
+            stdout=sp.DEVNULL,
+            stderr=sp.DEVNULL,
+        )
+    if _nailgun_server.poll() is None:
+        _nailgun_server.terminate()
+    try:
+        _nailgun_server.wait(timeout=10)
+    except sp.TimeoutExpired:
+        _nailgun_server.kill()
+        _nailgun_server.wait()
+    _nailgun_server = None
+    _nailgun_settings = None
+
+
+def _tsv_column(series):
+    """
+    Converts a column to an Arrow array that Arrow's CSV writer renders
+    exactly as DataFrame.to_csv() would, or returns None if the dtype is not
+    handled. Booleans and floats are rendered by NumPy, as Arrow would write
+    e.g. 'true' and '1' where pandas writes 'True' and '1.0'.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        categories = _tsv_column(series.cat.categories.to_series())
+        if categories is None:
+            return None
+        codes = series.cat.codes.to_numpy()
+        return categories.take(pa.array(codes, mask=codes < 0))
+    if dtype == object:
+        # Python objects are written with str(), missing values as empty
+        values = series.to_numpy()
+        return pa.array(np.where(pd.isna(values), "", values.astype(str)))
+    if dtype == bool:
+        return pa.array(np.where(series.to_numpy(), "True", "False"))
+    if isinstance(dtype, np.dtype) and dtype.kind == "f":
+        values = series.to_numpy()
+        return pa.array(np.where(np.isnan(values), "", values.astype(str)))
+    if pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+        return pa.array(series, from_pandas=True)
+    return None
+
+
+def write_tsv(df, path, header_lines=None):
+    """
+    Writes a DataFrame as a tab-separated file without its index, optionally
+    preceded by metadata header lines (see generate_header()).
+
+    The output is the same text DataFrame.to_csv(sep="\t", index=False)
+    produces; with pyarrow installed it is written by Arrow's CSV writer
+    from the column buffers. Frames with unsupported dtypes, or values that
+    would need quoting, are written by pandas instead.
+
+    Args:
+        df (pd.DataFrame): The table to write.
+        path (str): Destination file.
+        header_lines (list of str, optional): Lines written before the table.
+    """
+    prefix = "".join(line + "\n" for line in header_lines or [])
+    names = [str(column) for column in df.columns]
+    if pacsv is not None and not any(set(name) & set('\t"\n\r') for name in names):
+        columns = [_tsv_column(df[column]) for column in df.columns]
+        if all(column is not None for column in columns):
+            buffer = io.BytesIO()
+            try:
+                # Arrow always quotes the column names, so they are written
+                # with the header lines instead.
+                pacsv.write_csv(
+                    pa.Table.from_arrays(columns, names=names),
+                    buffer,
+                    write_options=pacsv.WriteOptions(
+                        include_header=False, delimiter="\t", quoting_style="none"
+                    ),
+                )
+            # Older pyarrow versions lack quoting_style (TypeError); any
+            # failure falls back to pandas.
+            except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError):
+                pass
+            else:
+                with open(path, "wb") as f:
+                    f.write((prefix + "\t".join(names) + "\n").encode())
+                    f.write(buffer.getbuffer())
+                return
+
+    with open(path, "w") as f:
+        f.write(prefix)
+        df.to_csv(f, sep="\t", index=False)
 
 
 def generate_header(reference_vntr, version=VERSION):
@@ -224,9 +480,16 @@ def run_kestrel(
     sizes from the config (often just a single size: 20).
 
     Steps:
-      1) Construct command for each k-mer size.
-      2) If the final VCF already exists, skip.
-      3) Otherwise, run Kestrel, capturing logs.
+      1) If the final VCF already exists, skip Kestrel and only postprocess it.
+      2) Otherwise, construct the command for each k-mer size.
+      3) Run Kestrel, capturing logs. With several k-mer sizes and
+         kestrel_settings.parallel_kmers enabled, the sizes run concurrently,
+         each in its own JVM, as many as memory and
+         kestrel_settings.max_parallel_kmers allow
+         (see run_kestrel_jobs_concurrently()). With
+         kestrel_settings.persistent_jvm enabled, the sizes instead run one
+         after another in a shared Nailgun JVM
+         (see start_kestrel_nailgun_server()).
       4) Convert Kestrel's SAM→BAM, index.
       5) Call `process_kestrel_output()` for final filtering.
 
@@ -249,6 +512,15 @@ def run_kestrel(
     """
     global kestrel_config  # Use globally loaded Kestrel config
 
+    # If the final VCF already exists, skip the Kestrel runs (and building
+    # their commands) but still postprocess it, so the results reflect it.
+    if vcf_path.is_file():
+        logging.info("VCF file already exists, skipping Kestrel run...")
+        process_kestrel_output(
+            output_dir, vcf_path, reference_vntr, kestrel_config, config
+        )
+        return
+
     kestrel_settings = kestrel_config.get("kestrel_settings", {})
     java_path = config["tools"]["java_path"]
     java_memory = kestrel_settings.get("java_memory", "12g")
@@ -260,6 +532,70 @@ def run_kestrel(
     # Retrieve additional settings (defaults to empty)
     additional_settings = kestrel_settings.get("additional_settings", "")
 
+    nailgun = None
+    if kestrel_settings.get("persistent_jvm", False):
+        nailgun = start_kestrel_nailgun_server(
+            java_path, java_memory, kestrel_path, kestrel_settings.get("nailgun", {})
+        )
+
+    # A Kestrel run inside the Nailgun server cannot be stopped from here, so
+    # the persistent JVM is used with the serial loop only.
+    if (
+        nailgun is None
+        and kestrel_settings.get("parallel_kmers", False)
+        and len(kmer_sizes) > 1
+    ):
+        # Each k-mer size gets its own VCF and working directory so the
+        # Kestrel runs can proceed side by side.
+        jobs = []
+        for kmer_size in kmer_sizes:
+            kmer_dir = os.path.join(output_dir, f"kmer_{kmer_size}")
+            os.makedirs(kmer_dir, exist_ok=True)
+            kmer_vcf = os.path.join(kmer_dir, vcf_path.name)
+            kmer_command = construct_kestrel_command(
+                kmer_size=kmer_size,
+                kestrel_path=kestrel_path,
+                reference_vntr=reference_vntr,
+                output_dir=kmer_dir,
+                fastq_1=fastq_1,
+                fastq_2=fastq_2,
+                vcf_out=kmer_vcf,
+                java_path=java_path,
+                java_memory=java_memory,
+                max_align_states=max_align_states,
+                max_hap_states=max_hap_states,
+                log_level=log_level_str,
+                sample_name=sample_name,
+                additional_settings=additional_settings,
+            )
+            log_file = os.path.join(output_dir, f"kestrel_kmer_{kmer_size}.log")
+            jobs.append((kmer_size, kmer_command, log_file, kmer_vcf))
+
+        max_workers = min(
+            len(jobs),
+            kestrel_worker_limit(
+                java_memory, kestrel_settings.get("max_parallel_kmers")
+            ),
+        )
+        result = run_kestrel_jobs_concurrently(jobs, max_workers)
+        if result is not None:
+            kmer_size, kmer_vcf = result
+            kmer_dir = os.path.dirname(kmer_vcf)
+            os.replace(kmer_vcf, vcf_path)
+            sam_file = os.path.join(output_dir, "output.sam")
+            os.replace(os.path.join(kmer_dir, "output.sam"), sam_file)
+            for job in jobs:
+                shutil.rmtree(os.path.dirname(job[3]), ignore_errors=True)
+
+            # Convert the intermediate SAM→BAM (for debugging or IGV)
+            convert_sam_to_bam_and_index(sam_file, output_dir)
+
+            # Postprocess final output
+            process_kestrel_output(
+                output_dir, vcf_path, reference_vntr, kestrel_config, config
+            )
+        return
+
     # Try each k-mer size in sequence. Usually just [20], can be more.
     for kmer_size in kmer_sizes:
         kmer_command = construct_kestrel_command(
@@ -277,19 +613,133 @@ def run_kestrel(
             log_level=log_level_str,
             sample_name=sample_name,
             additional_settings=additional_settings,
+            nailgun=nailgun,
         )
 
         log_file = os.path.join(output_dir, f"kestrel_kmer_{kmer_size}.log")
 
-        # If the final VCF already exists, skip new runs
+        logging.info(f"Launching Kestrel with k-mer size {kmer_size}...")
+
+        # Actually run the Kestrel command
+        if not run_command(kmer_command, log_file, critical=True):
+            logging.error(
+                f"Kestrel failed for k-mer size {kmer_size}. "
+                f"Check {log_file} for details."
+            )
+            raise RuntimeError(f"Kestrel failed for kmer size {kmer_size}.")
+
+        logging.info(
+            f"Mapping-free genotyping of MUC1-VNTR "
+            f"with k-mer size {kmer_size} done!"
+        )
+
+        # Now that Kestrel completed, confirm the VCF is present
         if vcf_path.is_file():
-            logging.info("VCF file already exists, skipping Kestrel run...")
-            return
-        else:
-            logging.info(f"Launching Kestrel with k-mer size {kmer_size}...")
+            # Convert the intermediate SAM→BAM (for debugging or IGV)
+            sam_file = os.path.join(output_dir, "output.sam")
+            convert_sam_to_bam_and_index(sam_file, output_dir)
+
+            # Postprocess final output
+            process_kestrel_output(
+                output_dir, vcf_path, reference_vntr, kestrel_config, config
+            )
+            break  # Stop after the first successful k-mer size
+
+
+def _java_memory_bytes(java_memory):
+    """
+    Converts a JVM heap size as given to -Xmx (e.g. "12g", "512m") to bytes.
+    Returns None if the value cannot be parsed.
+    """
+    units = {"k": 1 << 10, "m": 1 << 20, "g": 1 << 30, "t": 1 << 40}
+    value = str(java_memory).strip().lower()
+    try:
+        if value and value[-1] in units:
+            return int(value[:-1]) * units[value[-1]]
+        return int(value)
+    except ValueError:
+        return None
+
 
-            # Actually run the Kestrel command
-            if not run_command(kmer_command, log_file, critical=True):
+def kestrel_worker_limit(java_memory, max_parallel=None):
+    """
+    Number of Kestrel JVMs that may run at the same time: at most
+    `max_parallel` (kestrel_settings.max_parallel_kmers, default half the
+    CPUs), and no more than the available memory divided by the heap size
+    of one JVM. Always at least 1.
+    """
+    limit = max_parallel or max(1, (os.cpu_count() or 2) // 2)
+    heap = _java_memory_bytes(java_memory)
+    try:
+        available = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        available = None
+    if heap and available:
+        limit = min(limit, available // heap)
+    return max(1, int(limit))
+
+
+def run_kestrel_jobs_concurrently(jobs, max_workers):
+    """
+    Runs Kestrel for several k-mer sizes at once and returns the result the
+    serial loop in run_kestrel() would have used.
+
+    Up to `max_workers` runs are in flight. Results are taken in the order of
+    `jobs`: the first run (in that order) that succeeds and writes its VCF
+    wins, and the remaining runs are terminated to free their JVM heaps. As in
+    the serial loop, a failing run that comes before any success aborts.
+
+    Args:
+        jobs (list of tuple): (kmer_size, command, log_file, vcf_out) per k-mer
+            size, in order of preference.
+        max_workers (int): Maximum number of concurrent Kestrel processes.
+
+    Raises:
+        RuntimeError: If Kestrel fails for a k-mer size before any succeeded.
+
+    Returns:
+        tuple or None: (kmer_size, vcf_out) of the selected run, or None if
+            no run produced a VCF.
+    """
+    running = {}
+
+    def launch(index):
+        kmer_size, command, log_file, _ = jobs[index]
+        logging.info(f"Launching Kestrel with k-mer size {kmer_size}...")
+        log_handle = open(log_file, "w")
+        running[index] = (
+            sp.Popen(
+                command,
+                stdout=log_handle,
+                stderr=sp.STDOUT,
+                # Own process group, so stopping a run also stops any
+                # processes the JVM started.
+                start_new_session=True,
+            ),
+            log_handle,
+        )
+
+    def stop_all():
+        for process, log_handle in running.values():
+            try:
+                os.killpg(process.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+            process.wait()
+            log_handle.close()
+        running.clear()
+
+    next_index = 0
+    try:
+        for index, (kmer_size, _, log_file, vcf_out) in enumerate(jobs):
+            while next_index < len(jobs) and len(running) < max_workers:
+                launch(next_index)
+                next_index += 1
+
+            process, log_handle = running.pop(index)
+            returncode = process.wait()
+            log_handle.close()
+            if returncode != 0:
                 logging.error(
                     f"Kestrel failed for k-mer size {kmer_size}. "
                     f"Check {log_file} for details."
@@ -300,18 +750,11 @@ def run_kestrel(
                 f"Mapping-free genotyping of MUC1-VNTR "
                 f"with k-mer size {kmer_size} done!"
             )
-
-            # Now that Kestrel completed, confirm the VCF is present
-            if vcf_path.is_file():
-                # Convert the intermediate SAM→BAM (for debugging or IGV)
-                sam_file = os.path.join(output_dir, "output.sam")
-                convert_sam_to_bam_and_index(sam_file, output_dir)
-
-                # Postprocess final output
-                process_kestrel_output(
-                    output_dir, vcf_path, reference_vntr, kestrel_config, config
-                )
-                break  # Stop after the first successful k-mer size
+            if os.path.isfile(vcf_out):
+                return kmer_size, vcf_out
+    finally:
+        stop_all()
+    return None
 
 
 def process_kestrel_output(
@@ -372,8 +815,13 @@ def process_kestrel_output(
 
     # Step 5) Read the insertion & deletion VCFs
     header = generate_header(reference_vntr)
-    vcf_insertion = read_vcf_without_comments(output_ins)
-    vcf_deletion = read_vcf_without_comments(output_del)
+    # The unused columns (notably INFO) are skipped while parsing.
+    vcf_insertion = read_vcf_without_comments(
+        output_ins, exclude_columns=VCF_UNUSED_COLUMNS
+    )
+    vcf_deletion = read_vcf_without_comments(
+        output_del, exclude_columns=VCF_UNUSED_COLUMNS
+    )
 
     # If both are empty, produce an empty result file
     if vcf_insertion.empty and vcf_deletion.empty:
@@ -384,19 +832,8 @@ def process_kestrel_output(
     # Merge with MUC1 reference data
     muc1_ref = load_muc1_reference(reference_vntr)
 
-    # Preprocess insertion/deletion
-    insertion_df = (
-        preprocessing_insertion(vcf_insertion, muc1_ref)
-        if not vcf_insertion.empty
-        else pd.DataFrame()
-    )
-    deletion_df = (
-        preprocessing_deletion(vcf_deletion, muc1_ref)
-        if not vcf_deletion.empty
-        else pd.DataFrame()
-    )
-
-    combined_df = pd.concat([insertion_df, deletion_df], axis=0)
+    # Preprocess insertion/deletion together (one reference lookup)
+    combined_df = preprocessing_variants(vcf_insertion, vcf_deletion, muc1_ref)
     # Sort deterministically
     sort_columns = list(combined_df.columns)
     combined_df = combined_df.sort_values(by=sort_columns).reset_index(drop=True)
@@ -428,9 +865,7 @@ def process_kestrel_output(
 
     # Write the final processed results
     final_output_path = os.path.join(output_dir, "kestrel_result.tsv")
-    with open(final_output_path, "w") as f:
-        f.write("\n".join(header) + "\n")
-        processed_df.to_csv(f, sep="\t", index=False)
+    write_tsv(processed_df, final_output_path, header)
 
     logging.info("Kestrel VCF processing completed.")
     return processed_df
@@ -462,9 +897,7 @@ def output_empty_result(output_dir, header):
     }
     empty_df = pd.DataFrame(empty_result_data)
 
-    with open(final_output_path, "w") as f:
-        f.write("\n".join(header) + "\n")
-        empty_df.to_csv(f, sep="\t", index=False)
+    write_tsv(empty_df, final_output_path, header)
 
     logging.info(f"Empty result file with placeholder saved at {final_output_path}")
 
@@ -609,7 +1042,7 @@ def filter_final_dataframe(df: pd.DataFrame, output_dir: str) -> pd.DataFrame:
 
     # Write the unfiltered DataFrame to 'kestrel_pre_result.tsv' in output_dir
     pre_result_path = os.path.join(output_dir, "kestrel_pre_result.tsv")
-    df.to_csv(pre_result_path, sep="\t", index=False)
+    write_tsv(df, pre_result_path)
     logging.info("Wrote pre-filter DataFrame to %s", pre_result_path)
 
     # Columns we will require to be True if they exist
@@ -621,12 +1054,13 @@ def filter_final_dataframe(df: pd.DataFrame, output_dir: str) -> pd.DataFrame:
         "motif_filter_pass",
     ]
 
-    # Build a mask requiring all existing boolean filters == True
-    final_mask = pd.Series(True, index=df.index)
+    # Build a single mask requiring all existing boolean filters == True; the
+    # frame is indexed once at the end.
+    final_mask = np.ones(len(df), dtype=bool)
     for col in filter_cols:
         if col in df.columns:
             before_count = final_mask.sum()
-            final_mask &= df[col]
+            final_mask &= df[col].to_numpy(dtype=bool)
             after_count = final_mask.sum()
             logging.info(
                 "Filter column '%s' exists; %d -> %d rows remain after requiring True.",
@@ -637,7 +1071,7 @@ def filter_final_dataframe(df: pd.DataFrame, output_dir: str) -> pd.DataFrame:
         else:
             logging.info("Filter column '%s' not found; skipping.", col)
 
-    filtered_df = df[final_mask].copy()
+    filtered_df = df.loc[final_mask].reset_index(drop=True)
     logging.info("Final DataFrame has %d rows after all filters.", len(filtered_df))
 
     return filtered_df
@@ -26,9 +26,100 @@ References:
 - Saei et al., iScience 26, 107171 (2023).
 """
 
+import functools
 import logging
+import os
+
+import numpy as np
 import pandas as pd
-from Bio import SeqIO
+
+from vntyper.scripts.variant_parsing import VCF_STRING_DTYPE
+
+# VCF columns not used by the Kestrel postprocessing.
+VCF_UNUSED_COLUMNS = ["ID", "QUAL", "FILTER", "INFO", "FORMAT"]
+
+# Columns kept for the left and right motif candidates during annotation.
+_MOTIF_KEEP_COLS = [
+    "Motif",
+    "Motif_fasta",
+    "Variant",
+    "POS",
+    "REF",
+    "ALT",
+    "Motif_sequence",
+    "Estimated_Depth_AlternateVariant",
+    "Estimated_Depth_Variant_ActiveRegion",
+    "Depth_Score",
+    "Confidence",
+    "original_index",
+]
+
+# Schema of the annotated candidates (the kept columns plus 'POS_fasta').
+_CANDIDATE_SCHEMA = {
+    "Motif": VCF_STRING_DTYPE,
+    "Motif_fasta": VCF_STRING_DTYPE,
+    "Variant": VCF_STRING_DTYPE,
+    "POS": "int64",
+    "REF": VCF_STRING_DTYPE,
+    "ALT": VCF_STRING_DTYPE,
+    "Motif_sequence": VCF_STRING_DTYPE,
+    "Estimated_Depth_AlternateVariant": "int64",
+    "Estimated_Depth_Variant_ActiveRegion": "int64",
+    "Depth_Score": "float64",
+    "Confidence": VCF_STRING_DTYPE,
+    "original_index": "int64",
+    "POS_fasta": "int64",
+}
+
+# No candidates: used when the motif IDs cannot be split, so the pass/fail
+# marking below can rely on the candidate columns being present.
+_EMPTY_CANDIDATES = pd.DataFrame(
+    {column: pd.Series(dtype=dtype) for column, dtype in _CANDIDATE_SCHEMA.items()}
+)
+
+
+def _iter_fasta(fasta_path):
+    """
+    Yields (identifier, sequence) for each record of a FASTA file.
+
+    A minimal reader for the small motif FASTAs, parsed like Bio.SeqIO's
+    "fasta" format: the identifier is the first word of the '>' line, and
+    the sequence lines are joined with whitespace removed. Lines before the
+    first record are ignored. Only the current record's lines are held in
+    memory.
+    """
+    identifier = None
+    parts = []
+    with open(fasta_path, buffering=1 << 20) as fasta_file:
+        for line in fasta_file:
+            if line.startswith(">"):
+                if identifier is not None:
+                    yield identifier, "".join(parts)
+                title = line[1:].split(None, 1)
+                identifier = title[0] if title else ""
+                parts = []
+            elif identifier is not None:
+                parts.append("".join(line.split()))
+    if identifier is not None:
+        yield identifier, "".join(parts)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_muc1_reference(reference_file, mtime):
+    """
+    Parses the MUC1 reference FASTA into ['Motifs', 'Motif_sequence'].
+    Cached per path and modification time, like _read_motif_fasta.
+    """
+    identifiers = []
+    sequences = []
+    for identifier, sequence in _iter_fasta(reference_file):
+        identifiers.append(identifier)
+        sequences.append(sequence)
+
+    # Same string dtype as the VCF columns it is merged with.
+    return pd.DataFrame(
+        {"Motifs": identifiers, "Motif_sequence": sequences}, dtype=VCF_STRING_DTYPE
+    )
 
 
 def load_muc1_reference(reference_file):
@@ -44,15 +135,46 @@ def load_muc1_reference(reference_file):
         pd.DataFrame:
             Columns: ['Motifs', 'Motif_sequence']
     """
-    identifiers = []
-    sequences = []
+    muc1_ref = _read_muc1_reference(reference_file, os.path.getmtime(reference_file))
+    # Callers get their own frame; the cached one must not be modified.
+    return muc1_ref.copy()
+
+
+def _attach_motif_sequence(df, muc1_ref, variants):
+    """
+    Appends 'Motif_sequence' and 'Variant' (`variants`, a tag or one tag per
+    row) to `df`, looking up each 'Motifs' ID in the MUC1 reference.
+    Equivalent to a left merge on 'Motifs' (the reference IDs are unique), but
+    the lookup reads the 'Motifs' column only: the new columns are built as a
+    narrow frame and attached in one concat, so the remaining VCF columns
+    (one per sample on multi-sample input) are never joined or inserted into.
+    """
+    mapping = dict(
+        zip(muc1_ref["Motifs"].to_numpy(), muc1_ref["Motif_sequence"].to_numpy())
+    )
+    annotation = pd.DataFrame(
+        {"Motif_sequence": df["Motifs"].map(mapping), "Variant": variants},
+        index=df.index,
+    )
+    return pd.concat([df, annotation], axis=1)
 
-    with open(reference_file) as fasta_file:
-        for seq_record in SeqIO.parse(fasta_file, "fasta"):
-            identifiers.append(seq_record.id)
-            sequences.append(seq_record.seq)
 
-    return pd.DataFrame({"Motifs": identifiers, "Motif_sequence": sequences})
+def _rename_vcf_columns(df):
+    """
+    Renames '#CHROM' to 'Motifs' and the sample column to 'Sample' and drops
+    the unused VCF columns.
+    """
+    df = df.rename(columns={"#CHROM": "Motifs"})
+    df = df.drop(columns=VCF_UNUSED_COLUMNS, errors="ignore")
+    return df.rename(columns={df.columns[-1]: "Sample"})
+
+
+def _preprocess_variant(df, muc1_ref, variant_tag):
+    """
+    Shared implementation of preprocessing_insertion() and
+    preprocessing_deletion(); `variant_tag` is written to 'Variant'.
+    """
+    return _attach_motif_sequence(_rename_vcf_columns(df), muc1_ref, variant_tag)
 
 
 def preprocessing_insertion(df, muc1_ref):
@@ -61,9 +183,9 @@ def preprocessing_insertion(df, muc1_ref):
 
     Steps:
       - Rename '#CHROM' → 'Motifs'
-      - Drop unused columns (ID, QUAL, FILTER, INFO, FORMAT)
+      - Drop unused columns (ID, QUAL, FILTER, INFO, FORMAT), if still present
       - Rename last column → 'Sample'
-      - Merge with 'muc1_ref' to link motif IDs
+      - Look up each motif ID's sequence in 'muc1_ref'
 
     Args:
         df (pd.DataFrame): Insertion variants from a filtered VCF.
@@ -72,14 +194,7 @@ def preprocessing_insertion(df, muc1_ref):
     Returns:
         pd.DataFrame: Updated with columns for 'Variant' = 'Insertion'.
     """
-    df.rename(columns={"#CHROM": "Motifs"}, inplace=True)
-    columns_to_drop = ["ID", "QUAL", "FILTER", "INFO", "FORMAT"]
-    df.drop(columns=columns_to_drop, axis=1, inplace=True)
-    last_column_name = df.columns[-1]
-    df.rename(columns={last_column_name: "Sample"}, inplace=True)
-    df = pd.merge(df, muc1_ref, on="Motifs", how="left")
-    df["Variant"] = "Insertion"
-    return df
+    return _preprocess_variant(df, muc1_ref, "Insertion")
 
 
 def preprocessing_deletion(df, muc1_ref):
@@ -88,8 +203,8 @@ def preprocessing_deletion(df, muc1_ref):
 
     Steps:
       - Rename '#CHROM' → 'Motifs'
-      - Drop unused columns
-      - Merge with MUC1 reference
+      - Drop unused columns, if still present
+      - Look up each motif ID's sequence in the MUC1 reference
       - Mark 'Variant' = 'Deletion'
 
     Args:
@@ -99,14 +214,60 @@ def preprocessing_deletion(df, muc1_ref):
     Returns:
         pd.DataFrame: Updated with columns for 'Variant' = 'Deletion'.
     """
-    df.rename(columns={"#CHROM": "Motifs"}, inplace=True)
-    columns_to_drop = ["ID", "QUAL", "FILTER", "INFO", "FORMAT"]
-    df.drop(columns=columns_to_drop, axis=1, inplace=True)
-    last_column_name = df.columns[-1]
-    df.rename(columns={last_column_name: "Sample"}, inplace=True)
-    df = pd.merge(df, muc1_ref, on="Motifs", how="left")
-    df["Variant"] = "Deletion"
-    return df
+    return _preprocess_variant(df, muc1_ref, "Deletion")
+
+
+def preprocessing_variants(vcf_insertion, vcf_deletion, muc1_ref):
+    """
+    Preprocess insertion and deletion variants together: both are tagged and
+    combined first, then linked to the MUC1 reference motifs in a single lookup.
+
+    Equivalent to concatenating the results of preprocessing_insertion() and
+    preprocessing_deletion(), with one reference lookup instead of two.
+
+    Args:
+        vcf_insertion (pd.DataFrame): Insertion variants from a filtered VCF (may be empty).
+        vcf_deletion (pd.DataFrame): Deletion variants from a filtered VCF (may be empty).
+        muc1_ref (pd.DataFrame): MUC1 reference DataFrame with 'Motifs' & 'Motif_sequence'.
+
+    Returns:
+        pd.DataFrame: Columns as produced by preprocessing_insertion(), with
+            'Variant' set to 'Insertion' or 'Deletion'. Empty if both inputs are.
+    """
+    frames = []
+    tags = []
+    for df, variant_tag in ((vcf_insertion, "Insertion"), (vcf_deletion, "Deletion")):
+        if not df.empty:
+            frames.append(_rename_vcf_columns(df))
+            tags.append(np.repeat(variant_tag, len(df)))
+    if not frames:
+        return pd.DataFrame()
+    # 'Variant' is attached last, as in the separate preprocessing functions;
+    # the combined frame is later sorted by all columns.
+    return _attach_motif_sequence(
+        pd.concat(frames, ignore_index=True), muc1_ref, np.concatenate(tags)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _read_motif_fasta(fasta_path, mtime):
+    """
+    Parses a motif FASTA into ['Motif', 'Motif_sequence'] (uppercased).
+    Cached per path and modification time (`mtime` is only used as part of
+    the cache key), so repeated pipeline runs in one process parse the
+    reference once, while an edited file is read again.
+    """
+    identifiers = []
+    sequences = []
+    for identifier, sequence in _iter_fasta(fasta_path):
+        identifiers.append(identifier)
+        sequences.append(sequence.upper())
+
+    # Built directly in the string dtype used for the reference and VCF
+    # columns, so the constructor does not infer the type of every value.
+    return pd.DataFrame(
+        {"Motif": identifiers, "Motif_sequence": sequences}, dtype=VCF_STRING_DTYPE
+    )
 
 
 def load_additional_motifs(config):
@@ -125,19 +286,48 @@ def load_additional_motifs(config):
         pd.DataFrame:
             Columns: ['Motif', 'Motif_sequence']
     """
-    from Bio import SeqIO
-
-    identifiers = []
-    sequences = []
-
     muc1_motifs_rev_com_file = config["reference_data"]["muc1_motifs_rev_com"]
+    motifs = _read_motif_fasta(
+        muc1_motifs_rev_com_file, os.path.getmtime(muc1_motifs_rev_com_file)
+    )
+    # Callers get their own frame; the cached one must not be modified.
+    return motifs.copy()
 
-    with open(muc1_motifs_rev_com_file) as motif_file:
-        for seq_record in SeqIO.parse(motif_file, "fasta"):
-            identifiers.append(seq_record.id)
-            sequences.append(str(seq_record.seq.upper()))
 
-    return pd.DataFrame({"Motif": identifiers, "Motif_sequence": sequences})
+def _best_row_per_alt(df, columns):
+    """
+    Keeps one row per ALT: the row with the largest values of `columns`,
+    compared in order (NaN lowest), ties going to the earliest row.
+
+    These are the rows a stable descending sort by `columns` followed by
+    drop_duplicates("ALT") keeps, found with per-ALT maxima instead of a
+    full sort. Rows keep their original order.
+    """
+    codes, uniques = pd.factorize(df["ALT"], use_na_sentinel=False)
+    candidates = np.ones(len(df), dtype=bool)
+    for column in columns:
+        values = df[column].to_numpy(dtype=float)
+        values = np.where(candidates & ~np.isnan(values), values, -np.inf)
+        best = np.full(len(uniques), -np.inf)
+        np.maximum.at(best, codes, values)
+        candidates &= values == best[codes]
+
+    rows = np.flatnonzero(candidates)
+    first = np.full(len(uniques), len(df))
+    np.minimum.at(first, codes[rows], rows)
+    return df.iloc[np.sort(first)]
+
+
+def _annotate_candidates(candidates, motif_sequences):
+    """
+    Attaches each selected candidate's sequence from the additional motifs
+    and keeps the annotation columns. The sequence plays no part in which
+    candidates are selected, so it is looked up for the survivors only.
+    """
+    candidates = candidates.assign(
+        Motif_sequence=candidates["Motif"].map(motif_sequences)
+    )
+    return candidates[_MOTIF_KEEP_COLS]
 
 
 def motif_correction_and_annotation(df, merged_motifs, kestrel_config):
@@ -151,8 +341,13 @@ def motif_correction_and_annotation(df, merged_motifs, kestrel_config):
       - Ensures 'Motif_fasta', 'POS_fasta', and 'Motif' columns
         exist in the final output, even for failing rows.
     """
-    logging.debug("Entering motif_correction_and_annotation")
-    logging.debug(f"Initial row count: {len(df)}, columns: {df.columns.tolist()}")
+    # The column lists are only built when debug output is enabled.
+    debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+    if debug:
+        logging.debug("Entering motif_correction_and_annotation")
+        logging.debug(
+            "Initial row count: %d, columns: %s", len(df), df.columns.tolist()
+        )
 
     if df.empty:
         logging.debug("DataFrame is empty. Exiting motif_correction_and_annotation.")
@@ -167,140 +362,99 @@ def motif_correction_and_annotation(df, merged_motifs, kestrel_config):
     original_df["original_index"] = original_df.index
 
     mf = kestrel_config["motif_filtering"]
-    position_threshold = mf.get("position_threshold", 60)
-    exclude_motifs_right = mf.get("exclude_motifs_right", [])
+    position_threshold = int(mf.get("position_threshold", 60))
+    exclude_motifs_right = frozenset(mf.get("exclude_motifs_right", ()))
     alt_for_motif_right_gg = mf.get("alt_for_motif_right_gg", "GG")
-    motifs_for_alt_gg = mf.get("motifs_for_alt_gg", [])
-    exclude_alts_combined = mf.get("exclude_alts_combined", [])
-    exclude_motifs_combined = mf.get("exclude_motifs_combined", [])
+    motifs_for_alt_gg = frozenset(mf.get("motifs_for_alt_gg", ()))
+    exclude_alts_combined = frozenset(mf.get("exclude_alts_combined", ()))
+    exclude_motifs_combined = frozenset(mf.get("exclude_motifs_combined", ()))
 
     # =============== Original Logic ===============
     working_df = original_df.copy(deep=True)
 
     # Step 1) Ensure 'Motif_fasta'; check for dash
+    motif_parts = None
     if "Motifs" in working_df.columns:
         working_df["Motif_fasta"] = working_df["Motifs"]
+        # The split doubles as the format check: it yields exactly two
+        # columns when the most dashes in any motif ID is one.
+        motif_parts = working_df["Motifs"].str.split("-", expand=True)
     else:
         logging.error("Missing 'Motifs' column. Old code returns empty.")
-        combined_df = pd.DataFrame(columns=working_df.columns)
-        pass
 
-    if (
-        "Motifs" not in working_df.columns
-        or working_df["Motifs"].str.count("-").max() != 1
-    ):
+    if motif_parts is None or motif_parts.shape[1] != 2:
         logging.error("Cannot split 'Motifs' into left-right. Old code returns empty.")
-        combined_df = pd.DataFrame(columns=working_df.columns)
+        combined_df = _EMPTY_CANDIDATES.copy()
     else:
-        working_df[["Motif_left", "Motif_right"]] = working_df["Motifs"].str.split(
-            "-", expand=True
-        )
+        working_df[["Motif_left", "Motif_right"]] = motif_parts
+        # Few distinct values: as categoricals, the membership tests and the
+        # per-ALT grouping below work on integer codes. Only the working copy
+        # is converted; the returned frame keeps its string columns.
+        for column in ("Motif_left", "Motif_right", "REF", "ALT"):
+            working_df[column] = working_df[column].astype("category")
         working_df["POS"] = (
             pd.to_numeric(working_df["POS"], errors="coerce").fillna(-1).astype(int)
         )
+        # Motif sequences by ID, built once for both sides (the IDs are
+        # unique, so a lookup matches the left merge on 'Motif').
+        motif_sequences = dict(
+            zip(
+                merged_motifs["Motif"].to_numpy(),
+                merged_motifs["Motif_sequence"].to_numpy(),
+            )
+        )
 
-        # Left vs. Right
-        motif_left = working_df[working_df["POS"] < position_threshold].copy()
-        motif_right = working_df[working_df["POS"] >= position_threshold].copy()
+        # Left vs. Right (POS has no missing values here, so the right side is
+        # the complement). The halves are not copied up front: the rename
+        # below returns a new frame before anything is modified.
+        left_mask = working_df["POS"].to_numpy() < position_threshold
+        motif_left = working_df[left_mask]
+        motif_right = working_df[~left_mask]
 
-        # Merge + filter left
+        # Filter left, then annotate the remaining candidates
         if not motif_left.empty:
-            motif_left.rename(columns={"Motif_right": "Motif"}, inplace=True)
-            if "Motif_sequence" in motif_left.columns:
-                motif_left.drop(
-                    columns=["Motif_sequence"], inplace=True, errors="ignore"
-                )
-            motif_left = motif_left.merge(merged_motifs, on="Motif", how="left")
-
-            keep_cols = [
-                "Motif",
-                "Motif_fasta",
-                "Variant",
-                "POS",
-                "REF",
-                "ALT",
-                "Motif_sequence",
-                "Estimated_Depth_AlternateVariant",
-                "Estimated_Depth_Variant_ActiveRegion",
-                "Depth_Score",
-                "Confidence",
-                "original_index",
-            ]
-            motif_left = motif_left[keep_cols]
-            motif_left.sort_values(
-                ["Depth_Score", "POS"], ascending=[False, False], inplace=True
-            )
-            motif_left.drop_duplicates("ALT", keep="first", inplace=True)
+            motif_left = motif_left.rename(columns={"Motif_right": "Motif"})
+            motif_left = _best_row_per_alt(motif_left, ["Depth_Score", "POS"])
+            motif_left = _annotate_candidates(motif_left, motif_sequences)
 
-        # Merge + filter right
+        # Filter right, then annotate the remaining candidates
         if not motif_right.empty:
-            motif_right.rename(columns={"Motif_left": "Motif"}, inplace=True)
-            if "Motif_sequence" in motif_right.columns:
-                motif_right.drop(
-                    columns=["Motif_sequence"], inplace=True, errors="ignore"
-                )
-            motif_right = motif_right.merge(merged_motifs, on="Motif", how="left")
-
-            keep_cols = [
-                "Motif",
-                "Motif_fasta",
-                "Variant",
-                "POS",
-                "REF",
-                "ALT",
-                "Motif_sequence",
-                "Estimated_Depth_AlternateVariant",
-                "Estimated_Depth_Variant_ActiveRegion",
-                "Depth_Score",
-                "Confidence",
-                "original_index",
-            ]
-            motif_right = motif_right[keep_cols]
-
-            # 'GG' logic
-            if (
-                motif_right["ALT"]
-                .str.contains(r"\b" + alt_for_motif_right_gg + r"\b")
-                .any()
-            ):
+            motif_right = motif_right.rename(columns={"Motif_left": "Motif"})
+
+            # 'GG' logic (the rows kept below must equal the GG allele, so
+            # the check is a plain comparison rather than a regex search)
+            is_gg = motif_right["ALT"] == alt_for_motif_right_gg
+            if is_gg.any():
                 motif_right = motif_right[
-                    ~motif_right["Motif"].isin(exclude_motifs_right)
+                    ~motif_right["Motif"].isin(exclude_motifs_right) & is_gg
                 ]
-                motif_right = motif_right[motif_right["ALT"] == alt_for_motif_right_gg]
-                motif_right.sort_values("Depth_Score", ascending=False, inplace=True)
-                motif_right.drop_duplicates("ALT", keep="first", inplace=True)
-                if motif_right["Motif"].isin(motifs_for_alt_gg).any():
-                    motif_right = motif_right[
-                        motif_right["Motif"].isin(motifs_for_alt_gg)
-                    ]
+                motif_right = _best_row_per_alt(motif_right, ["Depth_Score"])
+                is_gg_motif = motif_right["Motif"].isin(motifs_for_alt_gg)
+                if is_gg_motif.any():
+                    motif_right = motif_right[is_gg_motif]
             else:
-                motif_right.sort_values("Depth_Score", ascending=False, inplace=True)
-                motif_right.drop_duplicates("ALT", keep="first", inplace=True)
-
-            motif_right.drop_duplicates(subset=["REF", "ALT"], inplace=True)
+                motif_right = _best_row_per_alt(motif_right, ["Depth_Score"])
+            # Each ALT now occurs at most once, so (REF, ALT) pairs are
+            # unique as well and need no further de-duplication.
+            motif_right = _annotate_candidates(motif_right, motif_sequences)
 
         # Combine
         combined_df = pd.concat([motif_right, motif_left], axis=0, ignore_index=True)
-        combined_df = combined_df[~combined_df["ALT"].isin(exclude_alts_combined)]
-        combined_df = combined_df[~combined_df["Motif"].isin(exclude_motifs_combined)]
+        combined_df = combined_df[
+            ~combined_df["ALT"].isin(exclude_alts_combined)
+            & ~combined_df["Motif"].isin(exclude_motifs_combined)
+        ]
 
-        # Adjust POS => create POS_fasta
-        combined_df["POS"] = (
-            pd.to_numeric(combined_df["POS"], errors="coerce").fillna(-1).astype(int)
-        )
+        # Adjust POS => create POS_fasta (POS is still the integer column
+        # cast after the left/right split)
         combined_df["POS_fasta"] = combined_df["POS"]
-        combined_df.update(
-            combined_df["POS"].mask(
-                combined_df["POS"] >= position_threshold,
-                lambda x: x - position_threshold,
-            )
-        )
+        # Branch-free remap: the comparison result (0/1) scales the shift.
+        pos = combined_df["POS"].to_numpy()
+        combined_df["POS"] = pos - position_threshold * (pos >= position_threshold)
     # =============== End Original Logic ===============
 
     # Mark pass/fail based on original_index
-    pass_mask = original_df["original_index"].isin(
-        combined_df.get("original_index", [])
-    )
+    pass_mask = original_df["original_index"].isin(combined_df["original_index"])
     original_df["motif_filter_pass"] = pass_mask
 
     # Ensure final columns exist in the main DF even for failing rows
@@ -318,17 +472,18 @@ def motif_correction_and_annotation(df, merged_motifs, kestrel_config):
         if idx in original_df.index:
             # Copy Motif_fasta / POS_fasta
             original_df.at[idx, "Motif_fasta"] = combined_df.at[idx, "Motif_fasta"]
-            if "POS_fasta" in combined_df.columns:
-                original_df.at[idx, "POS_fasta"] = combined_df.at[idx, "POS_fasta"]
+            original_df.at[idx, "POS_fasta"] = combined_df.at[idx, "POS_fasta"]
             # Also copy 'Motif'
-            if "Motif" in combined_df.columns:
-                original_df.at[idx, "Motif"] = combined_df.at[idx, "Motif"]
+            original_df.at[idx, "Motif"] = combined_df.at[idx, "Motif"]
 
     # Drop the temporary original_index column
     original_df.drop(columns=["original_index"], inplace=True, errors="ignore")
 
-    logging.debug("Exiting motif_correction_and_annotation")
-    logging.debug(
-        f"Final row count: {len(original_df)}, columns: {original_df.columns.tolist()}"
-    )
+    if debug:
+        logging.debug("Exiting motif_correction_and_annotation")
+        logging.debug(
+            "Final row count: %d, columns: %s",
+            len(original_df),
+            original_df.columns.tolist(),
+        )
     return original_df
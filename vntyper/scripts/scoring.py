@@ -29,6 +29,36 @@ import logging
 import pandas as pd
 import numpy as np
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+
+def _split_sample_arrow(sample: pd.Series):
+    """
+    Splits Arrow-backed 'Sample' strings on ':' with Arrow's columnar
+    splitter, without building the intermediate expanded DataFrame.
+
+    Returns:
+        list of pd.Series or None: The three fields, or None if pyarrow is
+            unavailable, the column is not Arrow-backed, or any row does not
+            have exactly three fields (left to the pandas path).
+    """
+    if pc is None or getattr(sample.dtype, "storage", None) not in (
+        "pyarrow",
+        "pyarrow_numpy",
+    ):
+        return None
+    parts = pc.split_pattern(pa.array(sample), ":")
+    if not pc.all(pc.equal(pc.list_value_length(parts), 3)).as_py():
+        return None
+    return [
+        pd.Series(pc.list_element(parts, i), index=sample.index, dtype=sample.dtype)
+        for i in range(3)
+    ]
+
 
 def split_depth_and_calculate_frame_score(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -59,22 +89,28 @@ def split_depth_and_calculate_frame_score(df: pd.DataFrame) -> pd.DataFrame:
         )
         return df
 
-    # Step 1) Split 'Sample' into 3 parts
-    split_columns = df["Sample"].str.split(":", expand=True)
-    split_columns.columns = [
+    # Step 1) Split 'Sample' into 3 parts. The parts are added as columns of
+    # `df` itself rather than concatenated, which would copy the whole frame.
+    split_names = [
         "Del",
         "Estimated_Depth_AlternateVariant",
         "Estimated_Depth_Variant_ActiveRegion",
     ]
-    df = pd.concat([df, split_columns], axis=1)
+    split_fields = _split_sample_arrow(df["Sample"])
+    if split_fields is not None:
+        for name, field in zip(split_names, split_fields):
+            df[name] = field
+    else:
+        df[split_names] = df["Sample"].str.split(":", expand=True)
 
     # Step 2) Compute lengths and frame score
     df["ref_len"] = df["REF"].str.len()
     df["alt_len"] = df["ALT"].str.len()
-    df["Frame_Score"] = (df["alt_len"] - df["ref_len"]) / 3
+    frame_diff = df["alt_len"].to_numpy() - df["ref_len"].to_numpy()
+    df["Frame_Score"] = frame_diff / 3
 
     # Step 3) Mark frameshift in a new boolean column
-    df["is_frameshift"] = (df["alt_len"] - df["ref_len"]) % 3 != 0
+    df["is_frameshift"] = frame_diff % 3 != 0
 
     logging.debug("Exiting split_depth_and_calculate_frame_score")
     logging.debug(f"Final row count: {len(df)}, columns: {df.columns.tolist()}")
@@ -97,7 +133,7 @@ def split_frame_score(df: pd.DataFrame) -> pd.DataFrame:
 
     Returns:
         pd.DataFrame:
-            Adds 'direction' and 'frameshift_amount'.
+            Adds 'direction' and 'frameshift_amount' (int8).
             Retains all rows and intermediate columns for debugging.
     """
     logging.debug("Entering split_frame_score")
@@ -107,11 +143,15 @@ def split_frame_score(df: pd.DataFrame) -> pd.DataFrame:
         logging.debug("DataFrame is empty. Exiting split_frame_score.")
         return df
 
+    frame_diff = df["alt_len"].to_numpy() - df["ref_len"].to_numpy()
+
+    # Both columns only hold small codes (-1/0/1 and 0/1/2), so they are
+    # stored as int8 rather than int64.
     # Step 1) Determine direction
-    df["direction"] = np.sign(df["alt_len"] - df["ref_len"])
+    df["direction"] = np.sign(frame_diff).astype(np.int8)
 
     # Step 2) Calculate frameshift_amount
-    df["frameshift_amount"] = (df["alt_len"] - df["ref_len"]).abs() % 3
+    df["frameshift_amount"] = (np.abs(frame_diff) % 3).astype(np.int8)
 
     logging.debug("Exiting split_frame_score")
     logging.debug(f"Final row count: {len(df)}, columns: {df.columns.tolist()}")
@@ -147,8 +187,10 @@ def extract_frameshifts(df: pd.DataFrame) -> pd.DataFrame:
         return df
 
     # Identify insertion vs deletion frameshifts
-    condition_insertion = (df["direction"] > 0) & (df["frameshift_amount"] == 1)
-    condition_deletion = (df["direction"] < 0) & (df["frameshift_amount"] == 2)
+    direction = df["direction"].to_numpy()
+    frameshift_amount = df["frameshift_amount"].to_numpy()
+    condition_insertion = (direction > 0) & (frameshift_amount == 1)
+    condition_deletion = (direction < 0) & (frameshift_amount == 2)
 
     df["is_valid_frameshift"] = condition_insertion | condition_deletion
 
@@ -10,25 +10,33 @@ import sys
 import gzip
 import importlib.resources as pkg_resources
 
+# Jinja2 environments by template directory, shared by the report generators.
+_ENV_CACHE = {}
+
 
 def run_command(command, log_file, critical=False):
     """
     Helper function to run a shell command and log its output.
 
     Args:
-        command (str): The command to run.
+        command (str or list): The command to run. A string is run through
+            Bash; an argument list is executed directly, without a shell.
         log_file (str): The path to the log file where stdout and stderr will be logged.
         critical (bool): If True, the pipeline will stop if the command fails.
 
     Returns:
         bool: True if the command succeeded, False otherwise.
     """
+    use_shell = isinstance(command, str)
+    if not use_shell:
+        command = [str(arg) for arg in command]
     logging.debug(f"Running command: {command}")
     with open(log_file, "w") as lf:
         process = subprocess.Popen(
             command,
-            shell=True,
-            executable="/bin/bash",  # Ensure Bash is used for process substitution
+            shell=use_shell,
+            # Ensure Bash is used for process substitution
+            executable="/bin/bash" if use_shell else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
         )
@@ -276,6 +284,93 @@ def load_config(config_path=None):
             sys.exit(1)
 
 
+def read_tsv(file_path, comment="#", names=None, skip_rows=None):
+    """
+    Reads a tab-separated file into a pandas DataFrame, skipping leading
+    comment lines.
+
+    If pyarrow is installed, its multi-threaded C++ CSV reader is used;
+    otherwise (or if pyarrow cannot parse the file, e.g. because of comment
+    lines after the header) this falls back to pandas.read_csv.
+
+    Args:
+        file_path (str): Path to the TSV file.
+        comment (str): Prefix marking comment lines. Defaults to "#".
+        names (list, optional): Column names. If given, the file is taken to
+            have no header row after the comment lines.
+        skip_rows (int, optional): Number of leading comment lines, if the
+            caller already counted them; both readers then skip exactly these
+            lines and the file is not pre-scanned.
+
+    Returns:
+        pd.DataFrame: The parsed table.
+    """
+    import pandas as pd
+
+    try:
+        from pyarrow import csv as pacsv
+    except ImportError:
+        pacsv = None
+
+    if pacsv is not None:
+        n_skip = skip_rows
+        if n_skip is None:
+            n_skip = 0
+            with open(file_path, "r") as f:
+                for line in f:
+                    if not line.startswith(comment):
+                        break
+                    n_skip += 1
+        try:
+            table = pacsv.read_csv(
+                file_path,
+                read_options=pacsv.ReadOptions(
+                    skip_rows=n_skip, column_names=names, use_threads=True
+                ),
+                parse_options=pacsv.ParseOptions(delimiter="\t"),
+            )
+            return table.to_pandas()
+        except Exception as e:
+            logging.debug(f"pyarrow could not read {file_path} ({e}); using pandas.")
+
+    header = 0 if names is None else None
+    if skip_rows is not None:
+        return pd.read_csv(
+            file_path, sep="\t", skiprows=skip_rows, header=header, names=names
+        )
+    return pd.read_csv(file_path, sep="\t", comment=comment, header=header, names=names)
+
+
+def get_jinja_env(template_dir):
+    """
+    Returns the Jinja2 environment for a template directory, creating it on
+    first use.
+
+    Parsed templates stay in the environment's cache for the life of the
+    process, and compiled templates are also kept in Jinja2's per-user
+    bytecode cache so later processes skip compilation. auto_reload is off,
+    so rendering does not re-check template mtimes.
+
+    Args:
+        template_dir (str or Path): Directory containing the templates.
+
+    Returns:
+        jinja2.Environment: The shared environment.
+    """
+    key = str(template_dir)
+    env = _ENV_CACHE.get(key)
+    if env is None:
+        from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+        env = Environment(
+            loader=FileSystemLoader(key),
+            bytecode_cache=FileSystemBytecodeCache(),
+            auto_reload=False,
+        )
+        _ENV_CACHE[key] = env
+    return env
+
+
 def validate_bam_file(file_path):
     """
     Validates the alignment file (BAM or CRAM) for existence, correct extension, and
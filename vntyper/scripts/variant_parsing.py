@@ -25,14 +25,41 @@ References:
 - Saei et al., iScience 26, 107171 (2023)
 """
 
+import csv
 import gzip
 import logging
-from typing import Optional
+from typing import Iterable, Optional
 
+import numpy as np
 import pandas as pd
 
 
-def read_vcf_without_comments(vcf_file: str) -> pd.DataFrame:
+def _vcf_string_dtype():
+    """
+    Arrow-backed string dtype with NaN missing values (the pandas 3 default
+    "str"), so the .str operations used downstream (len, split, contains) and
+    isin() run as vectorised Arrow kernels but return plain NumPy results.
+    Falls back to object columns if pyarrow is not installed.
+    """
+    try:
+        return pd.StringDtype("pyarrow", na_value=np.nan)
+    except ImportError:
+        return object
+    except TypeError:
+        pass
+    # pandas < 2.3 spells the same dtype "pyarrow_numpy"
+    try:
+        return pd.StringDtype("pyarrow_numpy")
+    except ImportError:
+        return object
+
+
+VCF_STRING_DTYPE = _vcf_string_dtype()
+
+
+def read_vcf_without_comments(
+    vcf_file: str, exclude_columns: Optional[Iterable[str]] = None
+) -> pd.DataFrame:
     """
     Reads a VCF file (possibly gzipped) ignoring lines starting with '##'.
     The line starting with '#CHROM' is used to define DataFrame columns.
@@ -40,22 +67,48 @@ def read_vcf_without_comments(vcf_file: str) -> pd.DataFrame:
     Args:
         vcf_file (str):
             Path to the VCF file, e.g., "output_insertion.vcf" or "output.vcf.gz".
+        exclude_columns (iterable of str, optional):
+            Columns that are not needed (e.g. INFO); they are skipped by the
+            parser and never materialised, which bounds memory on large VCFs.
 
     Returns:
         pd.DataFrame:
             Contains the main variant records. May be empty if the file has no variants.
     """
     open_func = gzip.open if vcf_file.endswith(".gz") else open
-    data = []
     header: Optional[list] = None
+    n_header_lines = 0
+    excluded = set(exclude_columns or ())
 
     try:
+        # Only the meta lines and the '#CHROM' line are read in Python; the
+        # records themselves are parsed by pandas' C reader in one pass.
         with open_func(vcf_file, "rt") as f:
             for line in f:
+                n_header_lines += 1
                 if line.startswith("#CHROM"):
                     header = line.strip().split("\t")
-                elif not line.startswith("##") and header:
-                    data.append(line.strip().split("\t"))
+                    break
+                if not line.startswith("##"):
+                    break
+        if header is None:
+            logging.debug("No variant records found in VCF.")
+            return pd.DataFrame()
+
+        # Every field is kept as literal text (no NA or quote handling), as
+        # the records were before.
+        df = pd.read_csv(
+            vcf_file,
+            sep="\t",
+            header=None,
+            names=header,
+            usecols=[column for column in header if column not in excluded],
+            skiprows=n_header_lines,
+            dtype=VCF_STRING_DTYPE,
+            na_filter=False,
+            quoting=csv.QUOTE_NONE,
+            engine="c",
+        )
     except FileNotFoundError:
         logging.error(f"VCF file not found: {vcf_file}")
         return pd.DataFrame()
@@ -63,9 +116,9 @@ def read_vcf_without_comments(vcf_file: str) -> pd.DataFrame:
         logging.error(f"Error reading VCF file {vcf_file}: {e}")
         return pd.DataFrame()
 
-    if data and header:
-        logging.debug(f"VCF read successfully with {len(data)} records.")
-        return pd.DataFrame(data, columns=header)
+    if not df.empty:
+        logging.debug(f"VCF read successfully with {len(df)} records.")
+        return df
     logging.debug("No variant records found in VCF.")
     return pd.DataFrame()
 